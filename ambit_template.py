@@ -26,6 +26,8 @@ def main():
                             'output_path'           : basepath+'/tmp/', # where results are written to
                             'output_path_0D'        : basepath+'/tmp/', # OPTIONAL: different output path for flow0d results (default: output_path)
                             'output_path_pre'       : basepath+'/tmp/', # OPTIONAL: different output path for pre-computed results (before time loop, e.g. prestress) (default: output_path)
+                            'jit_cache_dir'         : basepath+'/tmp/jit_cache', # OPTIONAL: fixed directory for the JIT-compiled form cache, to persist across runs (default: None, i.e. dolfinx's default)
+                            'jit_compile_args'      : ['-O2','-g0'], # OPTIONAL: extra C compiler arguments for the JIT-compiled forms, e.g. ['-O3','-march=native'] - but '-march=native' only if the jit_cache_dir is not shared between machines with different CPU types (default: None, i.e. dolfinx's default ['-O2','-g0'])
                             'results_to_write'      : ['displacement','velocity','pressure','cauchystress'], # see io_routines.py for what to write
                             'simname'               : 'my_simulation_name', # how to name the output (attention: there is no warning, results will be overwritten if existent)
                             'restart_step'          : 0, # OPTIONAL: at which time step to restart a former simulation (that crashed and shoud be resumed or whatever) (default: 0)
@@ -43,7 +45,9 @@ def main():
                             'ptc_randadapt_range'   : [0.85, 1.35], # OPTIONAL: in what range to randomly adapt PTC parameter if divergence continues to occur (default: [0.85, 1.35]) (only if divergence_continue is set to 'PTC')
                             'catch_max_res_value'   : 1e16, # OPTIONAL: max residual value when to catch a solver error (default: 1e16)
                             # direct linear solver settings (only apply for solve_type 'direct')
-                            'direct_solver'         : 'mumps', # OPTIONAL: type of direct solver: 'mumps' or 'superlu_dist' (default: 'mumps' - seems to be faster and more robust in case of saddle point problems)
+                            'direct_solver'         : 'mumps', # OPTIONAL: type of direct solver: 'mumps', 'superlu_dist', or 'strumpack' (default: 'mumps' - seems to be faster and more robust in case of saddle point problems) - STRUMPACK GPU offloading/compression can be controlled via PETSc options in the PETSC_OPTIONS environment variable, e.g. '-mat_strumpack_gpu 1 -mat_strumpack_compression hss' (requires a PETSc build with STRUMPACK)
+                            'mumps_icntl'           : {7 : 5}, # OPTIONAL: MUMPS integer controls ICNTL(i) as {i : value}, e.g. 7 : 5 for METIS ordering; note that PETSc already uses distributed matrix input (ICNTL(18)=3) in parallel (default: {})
+                            'mumps_cntl'            : {7 : 1e-10}, # OPTIONAL: MUMPS real controls CNTL(i) as {i : value}, e.g. Block Low-Rank compression with 'mumps_icntl' : {35 : 2} and dropping tolerance 7 : 1e-10 (well below the Newton tolerances) - reduces factor memory and time for large monolithic systems (default: {})
                             # iterative linear solver settings (only apply for solve_type 'iterative') - solver can only be GMRES
                             'iterative_solver'      : 'gmres', # OPTIONAL: type of iterative solver, cf. https://petsc.org/release/petsc4py/petsc4py.PETSc.KSP.Type-class.html (default: 'gmres')
                             'precond_fields'        : [{'prec':'amg','solve':'preonly'}, {'prec':'direct'}], # OPTIONAL: field-specific preconditioners (dict list has to have length of fields) (default: [])
@@ -58,6 +62,7 @@ def main():
                             'print_liniter_every'   : 10, # OPTIONAL: how often to print linear iterations (default: 1)
                             'indexset_options'      : {'rom_to_new' : False, 'lms_to_pres' : False}, # OPTIONAL: some options for the index sets (default: {})
                             'rebuild_prec_every_it' : 1, # OPTIONAL: rebuild the preconditioner every rebuild_prec_every_it iterations (default: 1)
+                            'lu_refactor_every_it'  : 1, # OPTIONAL: for solve_type 'direct': re-compute the LU factorization every lu_refactor_every_it iterations of a solve, otherwise re-use the old one (modified Newton if > 1) (default: 1)
                             # for local Newton (only for inelastic nonlinear materials at Gauss points, i.e. deformation-dependent growth)
                             'print_local_iter'      : False, # OPTIONAL: if we want to print iterations of local Newton (default: False)
                             'tol_res_local'         : 1.0e-10, # OPTIONAL: local Newton residual inf-norm tolerance (default: 1.0e-10)
@@ -203,8 +203,8 @@ class AleProblem(problem_base):
         ts = time.time()
         utilities.print_status("FEM form compilation for ALE...", self.comm, e=" ")
 
-        self.res_d = fem.form(self.weakform_d, entity_maps=self.io.entity_maps)
-        self.jac_dd = fem.form(self.weakform_lin_dd, entity_maps=self.io.entity_maps)
+        self.res_d = fem.form(self.weakform_d, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+        self.jac_dd = fem.form(self.weakform_lin_dd, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
 
         te = time.time() - ts
         utilities.print_status("t = %.4f s" % (te), self.comm)
@@ -715,9 +715,9 @@ class boundary_cond_fluid(boundary_cond):
             if on_subdomain:
                 # entity map child to parent
                 em_u = {self.io.mesh : self.io.submshes_emap[dom_u][1]}
-                qdict_.append( fem.form(q, entity_maps=em_u) )
+                qdict_.append( fem.form(q, entity_maps=em_u, jit_options=self.io.jit_options) )
             else:
-                qdict_.append( fem.form(q) )
+                qdict_.append( fem.form(q, jit_options=self.io.jit_options) )
 
 
     # set dp monitor conditions
@@ -761,8 +761,8 @@ class boundary_cond_fluid(boundary_cond):
             em_u = {self.io.mesh : self.io.submshes_emap[dom_u][1]}
             em_d = {self.io.mesh : self.io.submshes_emap[dom_d][1]}
 
-            a_u_.append( fem.form(a_u, entity_maps=em_u) )
-            a_d_.append( fem.form(a_d, entity_maps=em_d) )
+            a_u_.append( fem.form(a_u, entity_maps=em_u, jit_options=self.io.jit_options) )
+            a_d_.append( fem.form(a_d, entity_maps=em_d, jit_options=self.io.jit_options) )
 
-            pint_u_.append( fem.form(pint_u, entity_maps=em_u) )
-            pint_d_.append( fem.form(pint_d, entity_maps=em_d) )
+            pint_u_.append( fem.form(pint_u, entity_maps=em_u, jit_options=self.io.jit_options) )
+            pint_d_.append( fem.form(pint_d, entity_maps=em_d, jit_options=self.io.jit_options) )
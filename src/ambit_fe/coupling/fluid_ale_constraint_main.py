@@ -6,7 +6,7 @@
 # This source code is licensed under the MIT-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-import time, sys, copy
+import time, sys
 import numpy as np
 from dolfinx import fem
 import dolfinx.fem.petsc
@@ -126,7 +126,7 @@ class FluidmechanicsAleConstraintProblem(FluidmechanicsAleProblem,problem_base):
                     em_u = {self.io.mesh : self.pbf.io.submshes_emap[self.pbfc.coupling_params['constraint_physics'][i]['domain']][1]}
                 else:
                     em_u = self.pbf.io.entity_maps
-                self.dcqd_form.append(fem.form(self.dcqd[i], entity_maps=em_u))
+                self.dcqd_form.append(fem.form(self.dcqd[i], entity_maps=em_u, jit_options=self.io.jit_options))
 
             te = time.time() - ts
             utilities.print_status("t = %.4f s" % (te), self.comm)
@@ -246,7 +246,7 @@ class FluidmechanicsAleConstraintProblem(FluidmechanicsAleProblem,problem_base):
         for i in range(len(self.pbfc.row_ids)):
             # NOTE: only set the surface-subset of the k_sd vector entries to avoid placing unnecessary zeros!
             self.k_sd_vec[i].getSubVector(self.dofs_coupling_vq[i], subvec=self.k_sd_subvec[i])
-            self.K_sd.setValues(self.pbfc.row_ids[i], self.dofs_coupling_vq[i], self.k_sd_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+            self.K_sd.setValues(self.pbfc.row_ids[i], self.dofs_coupling_vq[i], self.k_sd_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
             self.k_sd_vec[i].restoreSubVector(self.dofs_coupling_vq[i], subvec=self.k_sd_subvec[i])
 
         self.K_sd.assemble()
@@ -432,7 +432,7 @@ class FluidmechanicsAleConstraintSolver(solver_base):
             raise ValueError("Unknown fluid-ALE coupling strategy! Choose either 'monolithic' or 'partitioned'.")
 
         if self.pb.pbf.prestress_initial or self.pb.pbf.prestress_initial_only:
-            solver_params_prestr = copy.deepcopy(self.solver_params)
+            solver_params_prestr = dict(self.solver_params) # shallow copy suffices, since only top-level keys are overwritten
             # modify solver parameters in case user specified alternating ones for prestressing (should do, because it's a 2x2 problem)
             try: solver_params_prestr['solve_type'] = self.solver_params['solve_type_prestr']
             except: pass
@@ -463,7 +463,7 @@ class FluidmechanicsAleConstraintSolver(solver_base):
             weakform_lin_aa = ufl.derivative(weakform_a, self.pb.pbf.a_old, self.pb.pbf.dv) # actually linear in a_old
 
             # solve for consistent initial acceleration a_old
-            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.io.entity_maps), fem.form(weakform_lin_aa, entity_maps=self.pb.io.entity_maps)
+            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options), fem.form(weakform_lin_aa, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options)
             self.solnln.solve_consistent_ini_acc(res_a, jac_aa, self.pb.pbf.a_old)
 
             te = time.time() - ts
@@ -6,7 +6,7 @@
 # This source code is licensed under the MIT-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-import time, sys, copy
+import time, sys
 import numpy as np
 from dolfinx import fem
 import dolfinx.fem.petsc
@@ -126,7 +126,7 @@ class FluidmechanicsAleFlow0DProblem(FluidmechanicsAleProblem,problem_base):
             self.dcqd_form = []
 
             for i in range(self.pbf0.num_coupling_surf):
-                self.dcqd_form.append(fem.form(self.pbf0.cq_factor[i]*self.dcqd[i], entity_maps=self.io.entity_maps))
+                self.dcqd_form.append(fem.form(self.pbf0.cq_factor[i]*self.dcqd[i], entity_maps=self.io.entity_maps, jit_options=self.io.jit_options))
 
             te = time.time() - ts
             utilities.print_status("t = %.4f s" % (te), self.comm)
@@ -174,11 +174,8 @@ class FluidmechanicsAleFlow0DProblem(FluidmechanicsAleProblem,problem_base):
         self.pbf0.assemble_residual(t, subsolver=subsolver)
         self.pba.assemble_residual(t)
 
-        # fluid
-        self.r_list[0] = self.pbf0.r_list[0]
-        self.r_list[1] = self.pbf0.r_list[1]
-        # flow0d
-        self.r_list[2] = self.pbf0.r_list[2]
+        # fluid and flow0d (in-place slice assignment, since the solver holds a reference to r_list)
+        self.r_list[:3] = self.pbf0.r_list[:3]
         # ALE
         self.r_list[3] = self.pba.r_list[0]
 
@@ -206,17 +203,10 @@ class FluidmechanicsAleFlow0DProblem(FluidmechanicsAleProblem,problem_base):
         self.pbf0.assemble_stiffness(t, subsolver=subsolver)
         self.pba.assemble_stiffness(t)
 
-        self.K_list[0][0] = self.pbf0.K_list[0][0]
-        self.K_list[0][1] = self.pbf0.K_list[0][1]
-        self.K_list[0][2] = self.pbf0.K_list[0][2]
-
-        self.K_list[1][0] = self.pbf0.K_list[1][0]
-        self.K_list[1][1] = self.pbf0.K_list[1][1]
-        self.K_list[1][2] = self.pbf0.K_list[1][2]
-
-        self.K_list[2][0] = self.pbf0.K_list[2][0]
-        self.K_list[2][1] = self.pbf0.K_list[2][1]
-        self.K_list[2][2] = self.pbf0.K_list[2][2]
+        # fluid and flow0d blocks (in-place slice assignment, since the solver holds references to the K_list rows)
+        self.K_list[0][:3] = self.pbf0.K_list[0][:3]
+        self.K_list[1][:3] = self.pbf0.K_list[1][:3]
+        self.K_list[2][:3] = self.pbf0.K_list[2][:3]
 
         # derivative of fluid momentum w.r.t. ALE displacement
         self.K_vd.zeroEntries()
@@ -234,16 +224,14 @@ class FluidmechanicsAleFlow0DProblem(FluidmechanicsAleProblem,problem_base):
         self.K_list[1][3] = self.K_pd
 
         # offdiagonal s-d rows: derivative of flux constraint w.r.t. ALE displacement (in case of moving coupling boundaries)
+        # assemble and set each row in one pass over the coupling surfaces
         for i in range(len(self.pbf0.row_ids)):
             with self.k_sd_vec[i].localForm() as r_local: r_local.set(0.0)
             fem.petsc.assemble_vector(self.k_sd_vec[i], self.dcqd_form[i])
             self.k_sd_vec[i].ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
-
-        # set rows
-        for i in range(len(self.pbf0.row_ids)):
             # NOTE: only set the surface-subset of the k_sd vector entries to avoid placing unnecessary zeros!
             self.k_sd_vec[i].getSubVector(self.dofs_coupling_vq[i], subvec=self.k_sd_subvec[i])
-            self.K_sd.setValues(self.pbf0.row_ids[i], self.dofs_coupling_vq[i], self.k_sd_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+            self.K_sd.setValues(self.pbf0.row_ids[i], self.dofs_coupling_vq[i], self.k_sd_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
             self.k_sd_vec[i].restoreSubVector(self.dofs_coupling_vq[i], subvec=self.k_sd_subvec[i])
 
         self.K_sd.assemble()
@@ -254,6 +242,8 @@ class FluidmechanicsAleFlow0DProblem(FluidmechanicsAleProblem,problem_base):
 
     def get_index_sets(self, isoptions={}):
 
+        pvec, lmvec, dvec = self.pbf.p.x.petsc_vec, self.pbf0.LM, self.pba.d.x.petsc_vec
+
         if self.rom is not None: # currently, ROM can only be on (subset of) first variable
             vvec_or0 = self.rom.V.getOwnershipRangeColumn()[0]
             vvec_ls = self.rom.V.getLocalSize()[1]
@@ -261,7 +251,10 @@ class FluidmechanicsAleFlow0DProblem(FluidmechanicsAleProblem,problem_base):
             vvec_or0 = self.pbf.v.x.petsc_vec.getOwnershipRange()[0]
             vvec_ls = self.pbf.v.x.petsc_vec.getLocalSize()
 
-        offset_v = vvec_or0 + self.pbf.p.x.petsc_vec.getOwnershipRange()[0] + self.pbf0.LM.getOwnershipRange()[0] + self.pba.d.x.petsc_vec.getOwnershipRange()[0]
+        # local sizes of the remaining fields - query each only once
+        pvec_ls, lmvec_ls, dvec_ls = pvec.getLocalSize(), lmvec.getLocalSize(), dvec.getLocalSize()
+
+        offset_v = vvec_or0 + pvec.getOwnershipRange()[0] + lmvec.getOwnershipRange()[0] + dvec.getOwnershipRange()[0]
         iset_v = PETSc.IS().createStride(vvec_ls, first=offset_v, step=1, comm=self.comm)
 
         if isoptions['rom_to_new']:
@@ -269,13 +262,13 @@ class FluidmechanicsAleFlow0DProblem(FluidmechanicsAleProblem,problem_base):
             iset_v = iset_v.difference(iset_r) # subtract
 
         offset_p = offset_v + vvec_ls
-        iset_p = PETSc.IS().createStride(self.pbf.p.x.petsc_vec.getLocalSize(), first=offset_p, step=1, comm=self.comm)
+        iset_p = PETSc.IS().createStride(pvec_ls, first=offset_p, step=1, comm=self.comm)
 
-        offset_s = offset_p + self.pbf.p.x.petsc_vec.getLocalSize()
-        iset_s = PETSc.IS().createStride(self.pbf0.LM.getLocalSize(), first=offset_s, step=1, comm=self.comm)
+        offset_s = offset_p + pvec_ls
+        iset_s = PETSc.IS().createStride(lmvec_ls, first=offset_s, step=1, comm=self.comm)
 
-        offset_d = offset_s + self.pbf0.LM.getLocalSize()
-        iset_d = PETSc.IS().createStride(self.pba.d.x.petsc_vec.getLocalSize(), first=offset_d, step=1, comm=self.comm)
+        offset_d = offset_s + lmvec_ls
+        iset_d = PETSc.IS().createStride(dvec_ls, first=offset_d, step=1, comm=self.comm)
 
         if isoptions['rom_to_new']:
             iset_s = iset_s.expand(iset_r) # add to 0D block
@@ -439,7 +432,7 @@ class FluidmechanicsAleFlow0DSolver(solver_base):
             raise ValueError("Unknown fluid-ALE coupling strategy! Choose either 'monolithic' or 'partitioned'.")
 
         if self.pb.pbf.prestress_initial or self.pb.pbf.prestress_initial_only:
-            solver_params_prestr = copy.deepcopy(self.solver_params)
+            solver_params_prestr = dict(self.solver_params) # shallow copy suffices, since only top-level keys are overwritten
             # modify solver parameters in case user specified alternating ones for prestressing (should do, because it's a 2x2 problem)
             try: solver_params_prestr['solve_type'] = self.solver_params['solve_type_prestr']
             except: pass
@@ -470,7 +463,7 @@ class FluidmechanicsAleFlow0DSolver(solver_base):
             weakform_lin_aa = ufl.derivative(weakform_a, self.pb.pbf.a_old, self.pb.pbf.dv) # actually linear in a_old
 
             # solve for consistent initial acceleration a_old
-            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.io.entity_maps), fem.form(weakform_lin_aa, entity_maps=self.pb.io.entity_maps)
+            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options), fem.form(weakform_lin_aa, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options)
             self.solnln.solve_consistent_ini_acc(res_a, jac_aa, self.pb.pbf.a_old)
 
             te = time.time() - ts
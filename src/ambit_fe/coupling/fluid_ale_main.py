@@ -6,7 +6,7 @@
 # This source code is licensed under the MIT-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-import time, sys, copy
+import time, sys
 import numpy as np
 from dolfinx import fem
 import dolfinx.fem.petsc
@@ -229,14 +229,14 @@ class FluidmechanicsAleProblem(problem_base):
                 self.weakform_lin_pd = sum(self.weakform_lin_pd)
 
             # coupling
-            self.jac_vd = fem.form(self.weakform_lin_vd, entity_maps=self.io.entity_maps)
-            self.jac_pd = fem.form(self.weakform_lin_pd, entity_maps=self.io.entity_maps)
+            self.jac_vd = fem.form(self.weakform_lin_vd, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+            self.jac_pd = fem.form(self.weakform_lin_pd, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
             if self.pbf.num_dupl > 1:
                 self.jac_pd_ = []
                 for j in range(self.pbf.num_dupl):
                     self.jac_pd_.append([self.jac_pd[j]])
             if self.have_weak_dirichlet_fluid_ale:
-                self.jac_dv = fem.form(self.weakform_lin_dv, entity_maps=self.io.entity_maps)
+                self.jac_dv = fem.form(self.weakform_lin_dv, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
 
             te = time.time() - ts
             utilities.print_status("t = %.4f s" % (te), self.comm)
@@ -346,14 +346,20 @@ class FluidmechanicsAleProblem(problem_base):
         if self.have_dbc_fluid_ale:
             # we need a vector representation of ufluid to apply in ALE DBCs
             self.pbf.ti.update_varint(self.pbf.v.x.petsc_vec, self.pbf.v_old.x.petsc_vec, self.pbf.uf_old.x.petsc_vec, self.pbase.dt, varintout=self.pbf.uf.x.petsc_vec, uflform=False)
-            self.ufa.x.petsc_vec.axpby(1.0, 0.0, self.pbf.uf.x.petsc_vec)
-            self.ufa.x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+            self.pbf.uf.x.petsc_vec.copy(result=self.ufa.x.petsc_vec)
+            self.ufa.x.petsc_vec.ghostUpdateBegin(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
 
         if self.have_dbc_ale_fluid:
             # we need a vector representation of w to apply in fluid DBCs
             self.pba.ti.update_dvar(self.pba.d.x.petsc_vec, self.pba.d_old.x.petsc_vec, self.pba.w_old.x.petsc_vec, self.pbase.dt, dvarout=self.pba.w.x.petsc_vec, uflform=False)
-            self.wf.x.petsc_vec.axpby(1.0, 0.0, self.pba.w.x.petsc_vec)
-            self.wf.x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+            self.pba.w.x.petsc_vec.copy(result=self.wf.x.petsc_vec)
+            self.wf.x.petsc_vec.ghostUpdateBegin(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+
+        # finish ghost updates only after both have been started, so that communication can overlap
+        if self.have_dbc_fluid_ale:
+            self.ufa.x.petsc_vec.ghostUpdateEnd(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+        if self.have_dbc_ale_fluid:
+            self.wf.x.petsc_vec.ghostUpdateEnd(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
 
 
     def get_index_sets(self, isoptions={}):
@@ -511,7 +517,7 @@ class FluidmechanicsAleSolver(solver_base):
             raise ValueError("Unknown fluid-ALE coupling strategy! Choose either 'monolithic' or 'partitioned'.")
 
         if self.pb.pbf.prestress_initial or self.pb.pbf.prestress_initial_only:
-            solver_params_prestr = copy.deepcopy(self.solver_params)
+            solver_params_prestr = dict(self.solver_params) # shallow copy suffices, since only top-level keys are overwritten
             # modify solver parameters in case user specified alternating ones for prestressing (should do, because it's a 2x2 problem)
             try: solver_params_prestr['solve_type'] = self.solver_params['solve_type_prestr']
             except: pass
@@ -542,7 +548,7 @@ class FluidmechanicsAleSolver(solver_base):
             weakform_lin_aa = ufl.derivative(weakform_a, self.pb.pbf.a_old, self.pb.pbf.dv) # actually linear in a_old
 
             # solve for consistent initial acceleration a_old
-            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.io.entity_maps), fem.form(weakform_lin_aa, entity_maps=self.pb.io.entity_maps)
+            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options), fem.form(weakform_lin_aa, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options)
             self.solnln.solve_consistent_ini_acc(res_a, jac_aa, self.pb.pbf.a_old)
 
             te = time.time() - ts
@@ -266,11 +266,11 @@ class FluidmechanicsConstraintProblem(problem_base):
                 em_u = {self.io.mesh : self.pbf.io.submshes_emap[self.coupling_params['constraint_physics'][i]['domain']][1]}
             else:
                 em_u = self.pbf.io.entity_maps
-            self.cq_form.append(fem.form(self.cq[i], entity_maps=em_u))
-            self.cq_old_form.append(fem.form(self.cq_old[i], entity_maps=em_u))
+            self.cq_form.append(fem.form(self.cq[i], entity_maps=em_u, jit_options=self.io.jit_options))
+            self.cq_old_form.append(fem.form(self.cq_old[i], entity_maps=em_u, jit_options=self.io.jit_options))
 
-            self.dcq_form.append(fem.form(self.dcq[i], entity_maps=em_u))
-            self.dforce_form.append(fem.form(self.dforce[i], entity_maps=self.pbf.io.entity_maps))
+            self.dcq_form.append(fem.form(self.dcq[i], entity_maps=em_u, jit_options=self.io.jit_options))
+            self.dforce_form.append(fem.form(self.dforce[i], entity_maps=self.pbf.io.entity_maps, jit_options=self.pbf.io.jit_options))
 
         te = time.time() - ts
         utilities.print_status("t = %.4f s" % (te), self.comm)
@@ -404,7 +404,7 @@ class FluidmechanicsConstraintProblem(problem_base):
         for i in range(len(self.col_ids)):
             # NOTE: only set the surface-subset of the k_vs vector entries to avoid placing unnecessary zeros!
             self.k_vs_vec[i].getSubVector(self.dofs_coupling_p[i], subvec=self.k_vs_subvec[i])
-            self.K_vs.setValues(self.dofs_coupling_p[i], self.col_ids[i], self.k_vs_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+            self.K_vs.setValues(self.dofs_coupling_p[i], self.col_ids[i], self.k_vs_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
             self.k_vs_vec[i].restoreSubVector(self.dofs_coupling_p[i], subvec=self.k_vs_subvec[i])
 
         self.K_vs.assemble()
@@ -413,7 +413,7 @@ class FluidmechanicsConstraintProblem(problem_base):
         for i in range(len(self.row_ids)):
             # NOTE: only set the surface-subset of the k_sv vector entries to avoid placing unnecessary zeros!
             self.k_sv_vec[i].getSubVector(self.dofs_coupling_vq[i], subvec=self.k_sv_subvec[i])
-            self.K_sv.setValues(self.row_ids[i], self.dofs_coupling_vq[i], self.k_sv_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+            self.K_sv.setValues(self.row_ids[i], self.dofs_coupling_vq[i], self.k_sv_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
             self.k_sv_vec[i].restoreSubVector(self.dofs_coupling_vq[i], subvec=self.k_sv_subvec[i])
 
         self.K_sv.assemble()
@@ -624,7 +624,7 @@ class FluidmechanicsConstraintSolver(solver_base):
             weakform_lin_aa = ufl.derivative(weakform_a, self.pb.pbf.a_old, self.pb.pbf.dv) # actually linear in a_old
 
             # solve for consistent initial acceleration a_old
-            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.pbf.io.entity_maps), fem.form(weakform_lin_aa, entity_maps=self.pb.pbf.io.entity_maps)
+            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.pbf.io.entity_maps, jit_options=self.pb.pbf.io.jit_options), fem.form(weakform_lin_aa, entity_maps=self.pb.pbf.io.entity_maps, jit_options=self.pb.pbf.io.jit_options)
             self.solnln.solve_consistent_ini_acc(res_a, jac_aa, self.pb.pbf.a_old)
 
             te = time.time() - ts
@@ -72,7 +72,7 @@ class FluidmechanicsFlow0DProblem(problem_base):
 
         # initialize problem instances (also sets the variational forms for the fluid problem)
         self.pbf = FluidmechanicsProblem(pbase, io_params, time_params_fluid, fem_params, constitutive_models, bc_dict, time_curves, io, mor_params=mor_params, alevar=alevar)
-        self.pb0 = Flow0DProblem(pbase, io_params, time_params_flow0d, model_params_flow0d, time_curves, coupling_params)
+        self.pb0 = Flow0DProblem(pbase, io_params, time_params_flow0d, model_params_flow0d, time_curves, coupling_params, coupling_type=self.coupling_type)
 
         self.pbrom = self.pbf # ROM problem can only be fluid
         self.pbrom_host = self
@@ -203,11 +203,11 @@ class FluidmechanicsFlow0DProblem(problem_base):
         self.cq_form, self.cq_old_form, self.dcq_form, self.dforce_form = [], [], [], []
 
         for i in range(self.num_coupling_surf):
-            self.cq_form.append(fem.form(self.cq[i], entity_maps=self.pbf.io.entity_maps))
-            self.cq_old_form.append(fem.form(self.cq_old[i], entity_maps=self.pbf.io.entity_maps))
+            self.cq_form.append(fem.form(self.cq[i], entity_maps=self.pbf.io.entity_maps, jit_options=self.pbf.io.jit_options))
+            self.cq_old_form.append(fem.form(self.cq_old[i], entity_maps=self.pbf.io.entity_maps, jit_options=self.pbf.io.jit_options))
 
-            self.dcq_form.append(fem.form(self.cq_factor[i]*self.dcq[i], entity_maps=self.pbf.io.entity_maps))
-            self.dforce_form.append(fem.form(self.dforce[i], entity_maps=self.pbf.io.entity_maps))
+            self.dcq_form.append(fem.form(self.cq_factor[i]*self.dcq[i], entity_maps=self.pbf.io.entity_maps, jit_options=self.pbf.io.jit_options))
+            self.dforce_form.append(fem.form(self.dforce[i], entity_maps=self.pbf.io.entity_maps, jit_options=self.pbf.io.jit_options))
 
         te = time.time() - ts
         utilities.print_status("t = %.4f s" % (te), self.comm)
@@ -223,8 +223,8 @@ class FluidmechanicsFlow0DProblem(problem_base):
 
         self.r_lm = PETSc.Vec().createMPI(size=self.num_coupling_surf)
 
-        # Lagrange multiplier stiffness matrix (currently treated with FD!)
-        self.K_lm = PETSc.Mat().createAIJ(size=(self.num_coupling_surf,self.num_coupling_surf), bsize=None, nnz=None, csr=None, comm=self.comm)
+        # Lagrange multiplier stiffness matrix (currently treated with FD!) - FD fills all entries, so preallocate dense rows
+        self.K_lm = PETSc.Mat().createAIJ(size=(self.num_coupling_surf,self.num_coupling_surf), bsize=None, nnz=self.num_coupling_surf, csr=None, comm=self.comm)
         self.K_lm.setUp()
         self.row_ids = list(range(self.num_coupling_surf))
         self.col_ids = list(range(self.num_coupling_surf))
@@ -290,7 +290,7 @@ class FluidmechanicsFlow0DProblem(problem_base):
             for i in range(len(self.col_ids)):
                 # NOTE: only set the surface-subset of the k_vs vector entries to avoid placing unnecessary zeros!
                 self.k_vs_vec[i].getSubVector(self.dofs_coupling_p[i], subvec=self.k_vs_subvec[i])
-                self.K_vs.setValues(self.dofs_coupling_p[i], self.col_ids[i], self.k_vs_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+                self.K_vs.setValues(self.dofs_coupling_p[i], self.col_ids[i], self.k_vs_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
                 self.k_vs_vec[i].restoreSubVector(self.dofs_coupling_p[i], subvec=self.k_vs_subvec[i])
             self.K_vs.assemble()
 
@@ -298,7 +298,7 @@ class FluidmechanicsFlow0DProblem(problem_base):
             for i in range(len(self.row_ids)):
                 # NOTE: only set the surface-subset of the k_sv vector entries to avoid placing unnecessary zeros!
                 self.k_sv_vec[i].getSubVector(self.dofs_coupling_vq[i], subvec=self.k_sv_subvec[i])
-                self.K_sv.setValues(self.row_ids[i], self.dofs_coupling_vq[i], self.k_sv_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+                self.K_sv.setValues(self.row_ids[i], self.dofs_coupling_vq[i], self.k_sv_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
                 self.k_sv_vec[i].restoreSubVector(self.dofs_coupling_vq[i], subvec=self.k_sv_subvec[i])
             self.K_sv.assemble()
 
@@ -364,7 +364,7 @@ class FluidmechanicsFlow0DProblem(problem_base):
             self.pb0.aux[:] = self.comm.bcast(self.pb0.aux, root=0)
 
         # add to fluid momentum equation
-        self.pb0.cardvasc0D.set_pressure_fem(self.LM, list(range(self.num_coupling_surf)), self.pr0D, self.coupfuncs)
+        self.pb0.cardvasc0D.set_pressure_fem(self.LM, self.row_ids, self.pr0D, self.coupfuncs)
 
         # fluid main blocks
         self.pbf.assemble_residual(t)
@@ -483,7 +483,7 @@ class FluidmechanicsFlow0DProblem(problem_base):
         for i in range(len(self.col_ids)):
             # NOTE: only set the surface-subset of the k_vs vector entries to avoid placing unnecessary zeros!
             self.k_vs_vec[i].getSubVector(self.dofs_coupling_p[i], subvec=self.k_vs_subvec[i])
-            self.K_vs.setValues(self.dofs_coupling_p[i], self.col_ids[i], self.k_vs_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+            self.K_vs.setValues(self.dofs_coupling_p[i], self.col_ids[i], self.k_vs_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
             self.k_vs_vec[i].restoreSubVector(self.dofs_coupling_p[i], subvec=self.k_vs_subvec[i])
 
         self.K_vs.assemble()
@@ -493,7 +493,7 @@ class FluidmechanicsFlow0DProblem(problem_base):
             for i in range(len(self.row_ids)):
                 # NOTE: only set the surface-subset of the k_sv vector entries to avoid placing unnecessary zeros!
                 self.k_sv_vec[i].getSubVector(self.dofs_coupling_vq[i], subvec=self.k_sv_subvec[i])
-                self.K_sv.setValues(self.row_ids[i], self.dofs_coupling_vq[i], self.k_sv_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+                self.K_sv.setValues(self.row_ids[i], self.dofs_coupling_vq[i], self.k_sv_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
                 self.k_sv_vec[i].restoreSubVector(self.dofs_coupling_vq[i], subvec=self.k_sv_subvec[i])
 
             self.K_sv.assemble()
@@ -512,10 +512,8 @@ class FluidmechanicsFlow0DProblem(problem_base):
                     for i in range(self.num_coupling_surf):
                         self.K_lm_array_invmat[i,i] = self.K_lm_array_inv[i,i]
 
-                # now set back to parallel K_lm_inv matrix (for efficient multiplications later on)
-                for i in range(ls, le):
-                    for j in range(self.num_coupling_surf):
-                        self.K_lm_inv.setValue(i, j, self.K_lm_array_inv[i,j], addv=PETSc.InsertMode.INSERT)
+                # now set back to parallel K_lm_inv matrix (for efficient multiplications later on) - all owned rows in one call
+                self.K_lm_inv.setValues(np.arange(ls, le, dtype=PETSc.IntType), np.arange(self.num_coupling_surf, dtype=PETSc.IntType), self.K_lm_array_inv[ls:le,:], addv=PETSc.InsertMode.INSERT)
                 self.K_lm_inv.assemble()
 
                 if self.condense_0d_model=='diag':
@@ -612,7 +610,7 @@ class FluidmechanicsFlow0DProblem(problem_base):
 
         self.pbf.evaluate_initial()
 
-        self.pb0.cardvasc0D.set_pressure_fem(self.LM_old, list(range(self.num_coupling_surf)), self.pr0D, self.coupfuncs_old)
+        self.pb0.cardvasc0D.set_pressure_fem(self.LM_old, self.row_ids, self.pr0D, self.coupfuncs_old)
 
         # special case: append upstream pressure to coupling array in case we don't have an LM, but a monitored pressure value
         if bool(self.pb0.chamber_models):
@@ -718,7 +716,7 @@ class FluidmechanicsFlow0DProblem(problem_base):
 
         # update old LMs
         self.LM_old.axpby(1.0, 0.0, self.LM)
-        self.pb0.cardvasc0D.set_pressure_fem(self.LM_old, list(range(self.num_coupling_surf)), self.pr0D, self.coupfuncs_old)
+        self.pb0.cardvasc0D.set_pressure_fem(self.LM_old, self.row_ids, self.pr0D, self.coupfuncs_old)
         # update old 3D fluxes
         self.constr_old[:] = self.constr[:]
 
@@ -803,7 +801,7 @@ class FluidmechanicsFlow0DSolver(solver_base):
             weakform_lin_aa = ufl.derivative(weakform_a, self.pb.pbf.a_old, self.pb.pbf.dv) # actually linear in a_old
 
             # solve for consistent initial acceleration a_old
-            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.pbf.io.entity_maps), fem.form(weakform_lin_aa, entity_maps=self.pb.pbf.io.entity_maps)
+            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.pbf.io.entity_maps, jit_options=self.pb.pbf.io.jit_options), fem.form(weakform_lin_aa, entity_maps=self.pb.pbf.io.entity_maps, jit_options=self.pb.pbf.io.jit_options)
             self.solnln.solve_consistent_ini_acc(res_a, jac_aa, self.pb.pbf.a_old)
 
             te = time.time() - ts
@@ -144,16 +144,16 @@ class FSIFlow0DProblem(FSIProblem,problem_base):
         ts = time.time()
         utilities.print_status("FEM form compilation for FSI coupling...", self.comm, e=" ")
 
-        self.res_l = fem.form(self.weakform_l, entity_maps=self.io.entity_maps)
-        self.jac_lu = fem.form(self.weakform_lin_lu, entity_maps=self.io.entity_maps)
-        self.jac_lv = fem.form(self.weakform_lin_lv, entity_maps=self.io.entity_maps)
+        self.res_l = fem.form(self.weakform_l, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+        self.jac_lu = fem.form(self.weakform_lin_lu, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+        self.jac_lv = fem.form(self.weakform_lin_lv, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
 
-        self.jac_ul = fem.form(self.weakform_lin_ul, entity_maps=self.io.entity_maps)
-        self.jac_vl = fem.form(self.weakform_lin_vl, entity_maps=self.io.entity_maps)
+        self.jac_ul = fem.form(self.weakform_lin_ul, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+        self.jac_vl = fem.form(self.weakform_lin_vl, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
 
         # even though this is zero, we still want to explicitly form and create the matrix for DBC application
-        self.jac_ll = fem.form(self.weakform_lin_ll, entity_maps=self.io.entity_maps)
-        self.jac_ll_dummy = fem.form(self.from_ll_diag_dummy, entity_maps=self.io.entity_maps)
+        self.jac_ll = fem.form(self.weakform_lin_ll, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+        self.jac_ll_dummy = fem.form(self.from_ll_diag_dummy, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
 
         te = time.time() - ts
         utilities.print_status("t = %.4f s" % (te), self.comm)
@@ -413,7 +413,7 @@ class FSIFlow0DSolver(solver_base):
             weakform_lin_aa_solid = ufl.derivative(weakform_a_solid, self.pb.pbs.a_old, self.pb.pbs.du) # actually linear in a_old
 
             # solve for consistent initial acceleration a_old
-            res_a_solid, jac_aa_solid = fem.form(weakform_a_solid, entity_maps=self.pb.io.entity_maps), fem.form(weakform_lin_aa_solid, entity_maps=self.pb.io.entity_maps)
+            res_a_solid, jac_aa_solid = fem.form(weakform_a_solid, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options), fem.form(weakform_lin_aa_solid, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options)
             self.solnln.solve_consistent_ini_acc(res_a_solid, jac_aa_solid, self.pb.pbs.a_old)
 
             te = time.time() - ts
@@ -431,7 +431,7 @@ class FSIFlow0DSolver(solver_base):
             weakform_lin_aa_fluid = ufl.derivative(weakform_a_fluid, self.pb.pbf.a_old, self.pb.pbf.dv) # actually linear in a_old
 
             # solve for consistent initial acceleration a_old
-            res_a_fluid, jac_aa_fluid = fem.form(weakform_a_fluid, entity_maps=self.pb.io.entity_maps), fem.form(weakform_lin_aa_fluid, entity_maps=self.pb.io.entity_maps)
+            res_a_fluid, jac_aa_fluid = fem.form(weakform_a_fluid, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options), fem.form(weakform_lin_aa_fluid, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options)
             self.solnln.solve_consistent_ini_acc(res_a_fluid, jac_aa_fluid, self.pb.pbf.a_old)
 
             te = time.time() - ts
@@ -6,7 +6,7 @@
 # This source code is licensed under the MIT-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-import time, sys, copy
+import time, sys
 import numpy as np
 from dolfinx import fem
 import dolfinx.fem.petsc
@@ -221,11 +221,11 @@ class SolidmechanicsConstraintProblem(problem_base):
         self.cq_form, self.cq_old_form, self.dcq_form, self.dforce_form = [], [], [], []
 
         for i in range(self.num_coupling_surf):
-            self.cq_form.append(fem.form(self.cq[i]))
-            self.cq_old_form.append(fem.form(self.cq_old[i]))
+            self.cq_form.append(fem.form(self.cq[i], jit_options=self.io.jit_options))
+            self.cq_old_form.append(fem.form(self.cq_old[i], jit_options=self.io.jit_options))
 
-            self.dcq_form.append(fem.form(self.dcq[i]))
-            self.dforce_form.append(fem.form(self.dforce[i]))
+            self.dcq_form.append(fem.form(self.dcq[i], jit_options=self.io.jit_options))
+            self.dforce_form.append(fem.form(self.dforce[i], jit_options=self.io.jit_options))
 
         te = time.time() - ts
         utilities.print_status("t = %.4f s" % (te), self.comm)
@@ -370,7 +370,7 @@ class SolidmechanicsConstraintProblem(problem_base):
         for i in range(len(self.col_ids)):
             # NOTE: only set the surface-subset of the k_us vector entries to avoid placing unnecessary zeros!
             self.k_us_vec[i].getSubVector(self.dofs_coupling_p[i], subvec=self.k_us_subvec[i])
-            self.K_us.setValues(self.dofs_coupling_p[i], self.col_ids[i], self.k_us_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+            self.K_us.setValues(self.dofs_coupling_p[i], self.col_ids[i], self.k_us_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
             self.k_us_vec[i].restoreSubVector(self.dofs_coupling_p[i], subvec=self.k_us_subvec[i])
 
         self.K_us.assemble()
@@ -379,7 +379,7 @@ class SolidmechanicsConstraintProblem(problem_base):
         for i in range(len(self.row_ids)):
             # NOTE: only set the surface-subset of the k_su vector entries to avoid placing unnecessary zeros!
             self.k_su_vec[i].getSubVector(self.dofs_coupling_vq[i], subvec=self.k_su_subvec[i])
-            self.K_su.setValues(self.row_ids[i], self.dofs_coupling_vq[i], self.k_su_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+            self.K_su.setValues(self.row_ids[i], self.dofs_coupling_vq[i], self.k_su_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
             self.k_su_vec[i].restoreSubVector(self.dofs_coupling_vq[i], subvec=self.k_su_subvec[i])
 
         self.K_su.assemble()
@@ -577,7 +577,7 @@ class SolidmechanicsConstraintSolver(solver_base):
         self.solnln = solver_nonlin.solver_nonlinear([self.pb], self.solver_params)
 
         if self.pb.pbs.prestress_initial or self.pb.pbs.prestress_initial_only:
-            solver_params_prestr = copy.deepcopy(self.solver_params)
+            solver_params_prestr = dict(self.solver_params) # shallow copy suffices, since only top-level keys are overwritten
             # modify solver parameters in case user specified alternating ones for prestressing (should do, because it's a 2x2 problem maximum)
             try: solver_params_prestr['solve_type'] = self.solver_params['solve_type_prestr']
             except: pass
@@ -607,7 +607,7 @@ class SolidmechanicsConstraintSolver(solver_base):
             weakform_lin_aa = ufl.derivative(weakform_a, self.pb.pbs.a_old, self.pb.pbs.du) # actually linear in a_old
 
             # solve for consistent initial acceleration a_old
-            res_a, jac_aa  = fem.form(weakform_a), fem.form(weakform_lin_aa)
+            res_a, jac_aa  = fem.form(weakform_a, jit_options=self.pb.io.jit_options), fem.form(weakform_lin_aa, jit_options=self.pb.io.jit_options)
             self.solnln.solve_consistent_ini_acc(res_a, jac_aa, self.pb.pbs.a_old)
 
             te = time.time() - ts
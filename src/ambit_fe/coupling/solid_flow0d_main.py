@@ -6,7 +6,7 @@
 # This source code is licensed under the MIT-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-import time, sys, copy
+import time, sys
 import numpy as np
 from dolfinx import fem
 import dolfinx.fem.petsc
@@ -61,7 +61,7 @@ class SolidmechanicsFlow0DProblem(problem_base):
 
         # initialize problem instances (also sets the variational forms for the solid problem)
         self.pbs = SolidmechanicsProblem(pbase, io_params, time_params_solid, fem_params, constitutive_models, bc_dict, time_curves, io, mor_params=mor_params)
-        self.pb0 = Flow0DProblem(pbase, io_params, time_params_flow0d, model_params_flow0d, time_curves, coupling_params)
+        self.pb0 = Flow0DProblem(pbase, io_params, time_params_flow0d, model_params_flow0d, time_curves, coupling_params, coupling_type=self.coupling_type)
 
         self.pbrom = self.pbs # ROM problem can only be solid
         self.pbrom_host = self
@@ -248,7 +248,7 @@ class SolidmechanicsFlow0DProblem(problem_base):
 
                     growth_thresolds.append(ufl.as_ufl(0))
 
-            growth_thres_proj = project(growth_thresolds, self.pbs.Vd_scalar, self.pbs.dx_, comm=self.comm)
+            growth_thres_proj = project(growth_thresolds, self.pbs.Vd_scalar, self.pbs.dx_, comm=self.comm, jit_options=self.io.jit_options)
             self.pbs.growth_param_funcs['growth_thres'].x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
             self.pbs.growth_param_funcs['growth_thres'].interpolate(growth_thres_proj)
 
@@ -293,11 +293,11 @@ class SolidmechanicsFlow0DProblem(problem_base):
         self.cq_form, self.cq_old_form, self.dcq_form, self.dforce_form = [], [], [], []
 
         for i in range(self.num_coupling_surf):
-            self.cq_form.append(fem.form(self.cq[i]))
-            self.cq_old_form.append(fem.form(self.cq_old[i]))
+            self.cq_form.append(fem.form(self.cq[i], jit_options=self.io.jit_options))
+            self.cq_old_form.append(fem.form(self.cq_old[i], jit_options=self.io.jit_options))
 
-            self.dcq_form.append(fem.form(self.cq_factor[i]*self.dcq[i]))
-            self.dforce_form.append(fem.form(self.dforce[i]))
+            self.dcq_form.append(fem.form(self.cq_factor[i]*self.dcq[i], jit_options=self.io.jit_options))
+            self.dforce_form.append(fem.form(self.dforce[i], jit_options=self.io.jit_options))
 
         te = time.time() - ts
         utilities.print_status("t = %.4f s" % (te), self.comm)
@@ -313,9 +313,9 @@ class SolidmechanicsFlow0DProblem(problem_base):
 
         self.r_lm = PETSc.Vec().createMPI(size=self.num_coupling_surf)
 
-        # Lagrange multiplier stiffness matrix (currently treated with FD!)
+        # Lagrange multiplier stiffness matrix (currently treated with FD!) - FD fills all entries, so preallocate dense rows
         if self.coupling_type == 'monolithic_lagrange':
-            self.K_lm = PETSc.Mat().createAIJ(size=(self.num_coupling_surf,self.num_coupling_surf), bsize=None, nnz=None, csr=None, comm=self.comm)
+            self.K_lm = PETSc.Mat().createAIJ(size=(self.num_coupling_surf,self.num_coupling_surf), bsize=None, nnz=self.num_coupling_surf, csr=None, comm=self.comm)
             self.K_lm.setUp()
             sze_coup = self.num_coupling_surf
             self.row_ids = list(range(self.num_coupling_surf))
@@ -403,7 +403,7 @@ class SolidmechanicsFlow0DProblem(problem_base):
                 self.pb0.aux[:] = self.comm.bcast(self.pb0.aux, root=0)
 
             # add to solid momentum equation
-            self.pb0.cardvasc0D.set_pressure_fem(self.LM, list(range(self.num_coupling_surf)), self.pr0D, self.coupfuncs)
+            self.pb0.cardvasc0D.set_pressure_fem(self.LM, self.row_ids, self.pr0D, self.coupfuncs)
 
         if self.coupling_type == 'monolithic_direct':
 
@@ -460,7 +460,7 @@ class SolidmechanicsFlow0DProblem(problem_base):
 
             # volumes/fluxes to be passed to 0D model
             for i in range(len(self.pb0.cardvasc0D.c_ids)):
-                cq = fem.assemble_scalar(fem.form(self.cq[i]))
+                cq = fem.assemble_scalar(self.cq_form[i])
                 cq = self.comm.allgather(cq)
                 self.pb0.c[i] = sum(cq)*self.cq_factor[i]
 
@@ -548,7 +548,7 @@ class SolidmechanicsFlow0DProblem(problem_base):
         for i in range(len(self.col_ids)):
             # NOTE: only set the surface-subset of the k_us vector entries to avoid placing unnecessary zeros!
             self.k_us_vec[i].getSubVector(self.dofs_coupling_p[i], subvec=self.k_us_subvec[i])
-            self.K_us.setValues(self.dofs_coupling_p[i], self.col_ids[i], self.k_us_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+            self.K_us.setValues(self.dofs_coupling_p[i], self.col_ids[i], self.k_us_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
             self.k_us_vec[i].restoreSubVector(self.dofs_coupling_p[i], subvec=self.k_us_subvec[i])
 
         self.K_us.assemble()
@@ -557,7 +557,7 @@ class SolidmechanicsFlow0DProblem(problem_base):
         for i in range(len(self.row_ids)):
             # NOTE: only set the surface-subset of the k_su vector entries to avoid placing unnecessary zeros!
             self.k_su_vec[i].getSubVector(self.dofs_coupling_vq[i], subvec=self.k_su_subvec[i])
-            self.K_su.setValues(self.row_ids[i], self.dofs_coupling_vq[i], self.k_su_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+            self.K_su.setValues(self.row_ids[i], self.dofs_coupling_vq[i], self.k_su_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
             self.k_su_vec[i].restoreSubVector(self.dofs_coupling_vq[i], subvec=self.k_su_subvec[i])
 
         self.K_su.assemble()
@@ -631,7 +631,7 @@ class SolidmechanicsFlow0DProblem(problem_base):
             self.pb0.cardvasc0D.set_pressure_fem(self.pb0.s_old, self.pb0.cardvasc0D.v_ids, self.pr0D, self.coupfuncs_old)
 
         if self.coupling_type == 'monolithic_lagrange':
-            self.pb0.cardvasc0D.set_pressure_fem(self.LM_old, list(range(self.num_coupling_surf)), self.pr0D, self.coupfuncs_old)
+            self.pb0.cardvasc0D.set_pressure_fem(self.LM_old, self.row_ids, self.pr0D, self.coupfuncs_old)
 
         if self.coupling_type == 'monolithic_direct':
             # old 3D coupling quantities (volumes or fluxes)
@@ -740,7 +740,7 @@ class SolidmechanicsFlow0DProblem(problem_base):
             self.pb0.cardvasc0D.set_pressure_fem(self.pb0.s_old, self.pb0.cardvasc0D.v_ids, self.pr0D, self.coupfuncs_old)
         if self.coupling_type == 'monolithic_lagrange':
             self.LM_old.axpby(1.0, 0.0, self.LM)
-            self.pb0.cardvasc0D.set_pressure_fem(self.LM_old, list(range(self.num_coupling_surf)), self.pr0D, self.coupfuncs_old)
+            self.pb0.cardvasc0D.set_pressure_fem(self.LM_old, self.row_ids, self.pr0D, self.coupfuncs_old)
             # update old 3D fluxes
             self.constr_old[:] = self.constr[:]
 
@@ -814,7 +814,7 @@ class SolidmechanicsFlow0DSolver(solver_base):
 
         if self.pb.pbs.prestress_initial or self.pb.pbs.prestress_initial_only:
             # initialize solid mechanics solver
-            solver_params_prestr = copy.deepcopy(self.solver_params)
+            solver_params_prestr = dict(self.solver_params) # shallow copy suffices, since only top-level keys are overwritten
             # modify solver parameters in case user specified alternating ones for prestressing (should do, because it's a 2x2 problem maximum)
             try: solver_params_prestr['solve_type'] = self.solver_params['solve_type_prestr']
             except: pass
@@ -844,7 +844,7 @@ class SolidmechanicsFlow0DSolver(solver_base):
             weakform_lin_aa = ufl.derivative(weakform_a, self.pb.pbs.a_old, self.pb.pbs.du) # actually linear in a_old
 
             # solve for consistent initial acceleration a_old
-            res_a, jac_aa  = fem.form(weakform_a), fem.form(weakform_lin_aa)
+            res_a, jac_aa  = fem.form(weakform_a, jit_options=self.pb.io.jit_options), fem.form(weakform_lin_aa, jit_options=self.pb.io.jit_options)
             self.solnln.solve_consistent_ini_acc(res_a, jac_aa, self.pb.pbs.a_old)
 
             te = time.time() - ts
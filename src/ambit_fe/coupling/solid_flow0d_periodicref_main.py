@@ -90,7 +90,7 @@ class SolidmechanicsFlow0DPeriodicRefSolver():
             if self.pb.coupling_type == 'monolithic_direct':
                 self.pb.pbs.ti.funcsexpr_to_update_pre[m].val = allgather_vec_entry(self.pb.pb0.s_old, self.pb.pb0.cardvasc0D.v_ids[i], self.pb.comm)
             if self.pb.coupling_type == 'monolithic_lagrange':
-                self.pb.pbs.ti.funcsexpr_to_update_pre[m].val = allgather_vec_entry(self.pb.LM_old, list(range(self.pb.num_coupling_surf))[i], self.pb.comm)
+                self.pb.pbs.ti.funcsexpr_to_update_pre[m].val = allgather_vec_entry(self.pb.LM_old, i, self.pb.comm)
 
             m.interpolate(self.pb.pbs.ti.funcsexpr_to_update_pre[m].evaluate)
             m.x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
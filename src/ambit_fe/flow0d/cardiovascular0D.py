@@ -10,12 +10,17 @@ import sys, time, math
 import numpy as np
 import sympy as sp
 
-from ..mpiroutines import allgather_vec_entry
+from ..mpiroutines import allgather_vec
 from ..oderoutines import ode
 
 
 class cardiovascular0Dbase(ode):
 
+    # chamber name mapping
+    chnames = {'lv' : 'v_l', 'rv' : 'v_r', 'la' : 'at_l', 'ra' : 'at_r', 'ao' : 'aort_sys'}
+    # "distributed" chamber pressures (no more than 10 in- and out-flow pressures allowed)
+    distributed_pressures = tuple('pi'+str(k+1) for k in range(10)) + tuple('po'+str(k+1) for k in range(10))
+
     def __init__(self, init=True, ode_par=False, comm=None):
 
         # initialize base class
@@ -28,14 +33,11 @@ class cardiovascular0Dbase(ode):
     # check for cardiac cycle periodicity
     def cycle_check(self, var, varTc, varTc_old, aux, auxTc, auxTc_old, t, cycle, cyclerr, eps_periodic, check=None, inioutpath=None, nm='', induce_pert_after_cycl=-1):
 
-        if self.ode_parallel: vs, ve = var.getOwnershipRange()
-        else: vs, ve = 0, len(var.array)
-
         is_periodic = False
 
         if self.T_cycl > 0. and np.isclose(math.fmod(t,self.T_cycl), 0.):
 
-            varTc[vs:ve] = var[vs:ve]
+            var.copy(result=varTc)
             auxTc[:] = aux[:]
 
             if check is not None: is_periodic = self.check_periodic(varTc, varTc_old, auxTc, auxTc_old, eps_periodic, check, cyclerr)
@@ -48,7 +50,7 @@ class cardiovascular0Dbase(ode):
             if is_periodic and inioutpath is not None:
                 self.write_initial(inioutpath, nm, varTc_old, varTc, auxTc_old, auxTc)
 
-            varTc_old[vs:ve] = varTc[vs:ve]
+            varTc.copy(result=varTc_old)
             auxTc_old[:] = auxTc[:]
 
             # update cycle counter
@@ -60,10 +62,12 @@ class cardiovascular0Dbase(ode):
     # some perturbations/diseases we want to simulate (mr: mitral regurgitation, ms: mitral stenosis, ar: aortic regurgitation, as: aortic stenosis)
     def induce_perturbation(self, perturb_type, perturb_factor):
 
-        if perturb_type=='mr': self.R_vin_l_max *= perturb_factor
-        if perturb_type=='ms': self.R_vin_l_min *= perturb_factor
-        if perturb_type=='ar': self.R_vout_l_max *= perturb_factor
-        if perturb_type=='as': self.R_vout_l_min *= perturb_factor
+        perturb_params = {'mr' : 'R_vin_l_max', 'ms' : 'R_vin_l_min', 'ar' : 'R_vout_l_max', 'as' : 'R_vout_l_min'}
+
+        # other perturbation types do not alter the model parameters, so the (costly) re-setting of expressions can be skipped
+        if perturb_type not in perturb_params: return
+
+        setattr(self, perturb_params[perturb_type], getattr(self, perturb_params[perturb_type]) * perturb_factor)
 
         # arrays need re-initialization, expressions have to be re-set
         self.setup_arrays(), self.set_compartment_interfaces()
@@ -73,9 +77,11 @@ class cardiovascular0Dbase(ode):
     # set pressure function for 3D FEM model
     def set_pressure_fem(self, var, ids, pr0D, p0Da):
 
+        var_sq = allgather_vec(var, self.comm)
+
         # set pressure functions
         for i in range(len(ids)):
-            pr0D.val = -allgather_vec_entry(var, ids[i], self.comm)
+            pr0D.val = -var_sq[ids[i]]
             p0Da[i].interpolate(pr0D.evaluate)
 
 
@@ -135,11 +141,7 @@ class cardiovascular0Dbase(ode):
         for i, ch in enumerate(['lv','rv','la','ra', 'ao']):
 
             # name mapping
-            if ch == 'lv': chn = 'v_l'
-            if ch == 'rv': chn = 'v_r'
-            if ch == 'la': chn = 'at_l'
-            if ch == 'ra': chn = 'at_r'
-            if ch == 'ao': chn = 'aort_sys'
+            chn = self.chnames[ch]
 
             # now the in- and out-flow indices in case of 3D-0D fluid coupling
             if ch == 'lv': # allow 1 in-flow, 1 ouf-flow for now...
@@ -264,26 +266,20 @@ class cardiovascular0Dbase(ode):
             self.fnc_.append(chfncs[0])
 
             # all "distributed" p are equal to "main" p of chamber (= pi1)
-            for k in range(10): # no more than 10 distributed p's allowed
-                if 'pi'+str(k+1) in chvars.keys(): chvars['pi'+str(k+1)] = chvars['pi1']
-                if 'po'+str(k+1) in chvars.keys(): chvars['po'+str(k+1)] = chvars['pi1']
+            self.set_distributed_pressures(chvars)
 
         # rigid
         elif self.chmodels[ch]['type']=='0D_rigid':
             chvars['VQ'] = 0
 
             # all "distributed" p are equal to "main" p of chamber (= pi1)
-            for k in range(10): # no more than 10 distributed p's allowed
-                if 'pi'+str(k+1) in chvars.keys(): chvars['pi'+str(k+1)] = chvars['pi1']
-                if 'po'+str(k+1) in chvars.keys(): chvars['po'+str(k+1)] = chvars['pi1']
+            self.set_distributed_pressures(chvars)
 
         # 3D solid mechanics model, or 0D prescribed volume/flux/pressure (non-primary variables!)
         elif self.chmodels[ch]['type']=='3D_solid' or self.chmodels[ch]['type']=='0D_prescr':
 
             # all "distributed" p are equal to "main" p of chamber (= pi1)
-            for k in range(10): # no more than 10 distributed p's allowed
-                if 'pi'+str(k+1) in chvars.keys(): chvars['pi'+str(k+1)] = chvars['pi1']
-                if 'po'+str(k+1) in chvars.keys(): chvars['po'+str(k+1)] = chvars['pi1']
+            self.set_distributed_pressures(chvars)
 
             if self.cq[i] == 'volume' or self.cq[i] == 'flux':
                 self.c_.append(chvars['VQ']) # V or Q
@@ -300,7 +296,7 @@ class cardiovascular0Dbase(ode):
 
             # all "distributed" p that are not coupled are set to first inflow p
             for k in range(self.chmodels[ch]['num_inflows'],10):
-                if 'pi'+str(k+1) in chvars.keys(): chvars['pi'+str(k+1)] = chvars['pi1']
+                if 'pi'+str(k+1) in chvars: chvars['pi'+str(k+1)] = chvars['pi1']
 
             # if no inflow is present, set to zero
             if self.chmodels[ch]['num_inflows']==0: chvars['pi1'] = sp.S.Zero
@@ -311,7 +307,7 @@ class cardiovascular0Dbase(ode):
 
             # all "distributed" p that are not coupled are set to first outflow p
             for k in range(self.chmodels[ch]['num_outflows'],10):
-                if 'po'+str(k+1) in chvars.keys(): chvars['po'+str(k+1)] = chvars['po1']
+                if 'po'+str(k+1) in chvars: chvars['po'+str(k+1)] = chvars['po1']
 
             # if no outflow is present, set to zero - except for special case:
             # if we have an LV surrounded by 3D flow domains (LA and AO),
@@ -334,6 +330,13 @@ class cardiovascular0Dbase(ode):
             raise NameError("Unknown chamber model for chamber %s!" % (ch))
 
 
+    # set all "distributed" in- and outflow p of a chamber (pi1, ..., pi10, po1, ..., po10) to its "main" p (= pi1)
+    def set_distributed_pressures(self, chvars):
+
+        for key in self.distributed_pressures:
+            if key in chvars: chvars[key] = chvars['pi1']
+
+
     # evaluate time-dependent state of chamber (for 0D elastance models)
     def evaluate_chamber_state(self, y, t):
 
@@ -374,11 +377,7 @@ class cardiovascular0Dbase(ode):
         for ch in ['lv','rv','la','ra', 'ao']:
 
             # name mapping
-            if ch == 'lv': chn = 'v_l'
-            if ch == 'rv': chn = 'v_r'
-            if ch == 'la': chn = 'at_l'
-            if ch == 'ra': chn = 'at_r'
-            if ch == 'ao': chn = 'aort_sys'
+            chn = self.chnames[ch]
 
             if self.chmodels[ch]['type']=='3D_solid':
 
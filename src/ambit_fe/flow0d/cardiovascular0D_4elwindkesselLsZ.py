@@ -11,7 +11,6 @@ import numpy as np
 import sympy as sp
 
 from .cardiovascular0D import cardiovascular0Dbase
-from ..mpiroutines import allgather_vec
 from .. import utilities
 
 """
@@ -168,8 +167,7 @@ class cardiovascular0D4elwindkesselLsZ(cardiovascular0Dbase):
 
     def print_to_screen(self, var, aux):
 
-        if self.ode_parallel: var_arr = allgather_vec(var, self.comm)
-        else: var_arr = var.array
+        var_arr = self.gather_vec(var)
 
         for n in range(self.num_models):
             utilities.print_status("Output of 0D model (4elwindkesselLsZ) "+str(n+1)+":", self.comm)
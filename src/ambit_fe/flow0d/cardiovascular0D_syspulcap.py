@@ -11,7 +11,6 @@ import numpy as np
 import sympy as sp
 
 from .cardiovascular0D import cardiovascular0Dbase
-from ..mpiroutines import allgather_vec
 from .. import utilities
 
 """
@@ -584,14 +583,14 @@ class cardiovascular0Dsyspulcap(cardiovascular0Dbase):
         elif check[0]=='specific':
 
             var_ids = []
-            for k in range(len(self.varmap)):
-                if list(self.varmap.keys())[k] in check[1]:
-                    var_ids.append(list(self.varmap.values())[k])
+            for k, i in self.varmap.items():
+                if k in check[1]:
+                    var_ids.append(i)
 
             aux_ids = []
-            for k in range(len(self.auxmap)):
-                if list(self.auxmap.keys())[k] in check[1]:
-                    aux_ids.append(list(self.auxmap.values())[k])
+            for k, i in self.auxmap.items():
+                if k in check[1]:
+                    aux_ids.append(i)
 
         else:
             raise NameError("Unknown check option!")
@@ -617,8 +616,7 @@ class cardiovascular0Dsyspulcap(cardiovascular0Dbase):
 
     def print_to_screen(self, var, aux):
 
-        if self.ode_parallel: var_arr = allgather_vec(var, self.comm)
-        else: var_arr = var.array
+        var_arr = self.gather_vec(var)
 
         nc = len(self.c_)
 
@@ -1079,14 +1077,14 @@ class cardiovascular0Dsyspulcapcor(cardiovascular0Dsyspulcap):
         elif check[0]=='specific':
 
             var_ids = []
-            for k in range(len(self.varmap)):
-                if list(self.varmap.keys())[k] in check[1]:
-                    var_ids.append(list(self.varmap.values())[k])
+            for k, i in self.varmap.items():
+                if k in check[1]:
+                    var_ids.append(i)
 
             aux_ids = []
-            for k in range(len(self.auxmap)):
-                if list(self.auxmap.keys())[k] in check[1]:
-                    aux_ids.append(list(self.auxmap.values())[k])
+            for k, i in self.auxmap.items():
+                if k in check[1]:
+                    aux_ids.append(i)
 
         else:
             raise NameError("Unknown check option!")
@@ -1112,8 +1110,7 @@ class cardiovascular0Dsyspulcapcor(cardiovascular0Dsyspulcap):
 
     def print_to_screen(self, var, aux):
 
-        if self.ode_parallel: var_arr = allgather_vec(var, self.comm)
-        else: var_arr = var.array
+        var_arr = self.gather_vec(var)
 
         nc = len(self.c_)
 
@@ -11,7 +11,6 @@ import numpy as np
 import sympy as sp
 
 from .cardiovascular0D_syspulcap import cardiovascular0Dsyspulcap
-from ..mpiroutines import allgather_vec
 from .. import utilities
 
 """
@@ -744,14 +743,14 @@ class cardiovascular0Dsyspulcaprespir(cardiovascular0Dsyspulcap):
         elif check[0]=='specific':
 
             var_ids = []
-            for k in range(len(self.varmap)):
-                if list(self.varmap.keys())[k] in check[1]:
-                    var_ids.append(list(self.varmap.values())[k])
+            for k, i in self.varmap.items():
+                if k in check[1]:
+                    var_ids.append(i)
 
             aux_ids = []
-            for k in range(len(self.auxmap)):
-                if list(self.auxmap.keys())[k] in check[1]:
-                    aux_ids.append(list(self.auxmap.values())[k])
+            for k, i in self.auxmap.items():
+                if k in check[1]:
+                    aux_ids.append(i)
 
         else:
             raise NameError("Unknown check option!")
@@ -777,8 +776,7 @@ class cardiovascular0Dsyspulcaprespir(cardiovascular0Dsyspulcap):
 
     def print_to_screen(self, var, aux):
 
-        if self.ode_parallel: var_arr = allgather_vec(var, self.comm)
-        else: var_arr = var.array
+        var_arr = self.gather_vec(var)
 
         cardiovascular0Dsyspulcap.print_to_screen(self, var, aux)
 
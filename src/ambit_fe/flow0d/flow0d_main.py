@@ -6,7 +6,7 @@
 # This source code is licensed under the MIT-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-import sys
+import sys, importlib
 import numpy as np
 
 from petsc4py import PETSc
@@ -17,11 +17,21 @@ from .. import utilities
 
 from ..base import problem_base, solver_base
 
+# available 0D models: modeltype -> (module, class, whether model takes chamber/valve/coronary/vad specs)
+model_registry = {'2elwindkessel'    : ('cardiovascular0D_2elwindkessel', 'cardiovascular0D2elwindkessel', False),
+                  '4elwindkesselLsZ' : ('cardiovascular0D_4elwindkesselLsZ', 'cardiovascular0D4elwindkesselLsZ', False),
+                  '4elwindkesselLpZ' : ('cardiovascular0D_4elwindkesselLpZ', 'cardiovascular0D4elwindkesselLpZ', False),
+                  'CRLinoutlink'     : ('cardiovascular0D_CRLinoutlink', 'cardiovascular0DCRLinoutlink', False),
+                  'syspul'           : ('cardiovascular0D_syspul', 'cardiovascular0Dsyspul', True),
+                  'syspulcap'        : ('cardiovascular0D_syspulcap', 'cardiovascular0Dsyspulcap', True),
+                  'syspulcapcor'     : ('cardiovascular0D_syspulcap', 'cardiovascular0Dsyspulcapcor', True),
+                  'syspulcaprespir'  : ('cardiovascular0D_syspulcaprespir', 'cardiovascular0Dsyspulcaprespir', True)}
+
 # framework of 0D flow models, relating pressure p (and its derivative) to fluxes q
 
 class Flow0DProblem(problem_base):
 
-    def __init__(self, pbase, io_params, time_params, model_params, time_curves, coupling_params={}):
+    def __init__(self, pbase, io_params, time_params, model_params, time_curves, coupling_params={}, coupling_type=None):
 
         self.pbase = pbase
 
@@ -68,7 +78,8 @@ class Flow0DProblem(problem_base):
         self.cq = coupling_params.get('coupling_quantity', ['volume']*5)
         self.vq = coupling_params.get('variable_quantity', ['pressure']*5)
 
-        self.coup_type = coupling_params.get('coupling_type', None)
+        # 3D-0D coupling type as resolved by the coupled problem ('monolithic_direct' or 'monolithic_lagrange'), None for a standalone 0D problem
+        self.coup_type = coupling_type
 
         self.eps_periodic = time_params.get('eps_periodic', 1e-20)
 
@@ -94,32 +105,15 @@ class Flow0DProblem(problem_base):
         self.have_induced_pert = False
 
         # initialize 0D model class - currently, we always init with True since restart will generate new output file names (so no need to append to old ones)
-        if model_params['modeltype'] == '2elwindkessel':
-            from .cardiovascular0D_2elwindkessel import cardiovascular0D2elwindkessel
-            self.cardvasc0D = cardiovascular0D2elwindkessel(model_params['parameters'], self.cq, self.vq, init=True, ode_par=self.ode_parallel, comm=self.comm)
-        elif model_params['modeltype'] == '4elwindkesselLsZ':
-            from .cardiovascular0D_4elwindkesselLsZ import cardiovascular0D4elwindkesselLsZ
-            self.cardvasc0D = cardiovascular0D4elwindkesselLsZ(model_params['parameters'], self.cq, self.vq, init=True, ode_par=self.ode_parallel, comm=self.comm)
-        elif model_params['modeltype'] == '4elwindkesselLpZ':
-            from .cardiovascular0D_4elwindkesselLpZ import cardiovascular0D4elwindkesselLpZ
-            self.cardvasc0D = cardiovascular0D4elwindkesselLpZ(model_params['parameters'], self.cq, self.vq, init=True, ode_par=self.ode_parallel, comm=self.comm)
-        elif model_params['modeltype'] == 'CRLinoutlink':
-            from .cardiovascular0D_CRLinoutlink import cardiovascular0DCRLinoutlink
-            self.cardvasc0D = cardiovascular0DCRLinoutlink(model_params['parameters'], self.cq, self.vq, init=True, ode_par=self.ode_parallel, comm=self.comm)
-        elif model_params['modeltype'] == 'syspul':
-            from .cardiovascular0D_syspul import cardiovascular0Dsyspul
-            self.cardvasc0D = cardiovascular0Dsyspul(model_params['parameters'], self.chamber_models, self.cq, self.vq, valvelaws=valvelaws, cormodel=self.coronary_model, vadmodel=self.vad_model, init=True, ode_par=self.ode_parallel, comm=self.comm)
-        elif model_params['modeltype'] == 'syspulcap':
-            from .cardiovascular0D_syspulcap import cardiovascular0Dsyspulcap
-            self.cardvasc0D = cardiovascular0Dsyspulcap(model_params['parameters'], self.chamber_models, self.cq, self.vq, valvelaws=valvelaws, cormodel=self.coronary_model, vadmodel=self.vad_model, init=True, ode_par=self.ode_parallel, comm=self.comm)
-        elif model_params['modeltype'] == 'syspulcapcor':
-            from .cardiovascular0D_syspulcap import cardiovascular0Dsyspulcapcor
-            self.cardvasc0D = cardiovascular0Dsyspulcapcor(model_params['parameters'], self.chamber_models, self.cq, self.vq, valvelaws=valvelaws, cormodel=self.coronary_model, vadmodel=self.vad_model, init=True, ode_par=self.ode_parallel, comm=self.comm)
-        elif model_params['modeltype'] == 'syspulcaprespir':
-            from .cardiovascular0D_syspulcaprespir import cardiovascular0Dsyspulcaprespir
-            self.cardvasc0D = cardiovascular0Dsyspulcaprespir(model_params['parameters'], self.chamber_models, self.cq, self.vq, valvelaws=valvelaws, cormodel=self.coronary_model, vadmodel=self.vad_model, init=True, ode_par=self.ode_parallel, comm=self.comm)
-        else:
+        try:
+            modname, clsname, heartmodel = model_registry[model_params['modeltype']]
+        except KeyError:
             raise NameError("Unknown 0D modeltype!")
+        model_class = getattr(importlib.import_module('.'+modname, __package__), clsname)
+        if heartmodel:
+            self.cardvasc0D = model_class(model_params['parameters'], self.chamber_models, self.cq, self.vq, valvelaws=valvelaws, cormodel=self.coronary_model, vadmodel=self.vad_model, init=True, ode_par=self.ode_parallel, comm=self.comm)
+        else:
+            self.cardvasc0D = model_class(model_params['parameters'], self.cq, self.vq, init=True, ode_par=self.ode_parallel, comm=self.comm)
 
         self.numdof = self.cardvasc0D.numdof
 
@@ -131,7 +125,10 @@ class Flow0DProblem(problem_base):
         # vectors and matrices
         if self.ode_parallel:
             self.K = PETSc.Mat().createAIJ(size=(self.numdof,self.numdof), bsize=None, nnz=None, csr=None, comm=self.comm)
-        else:
+        elif self.coup_type in [None, 'monolithic_lagrange'] and self.numdof <= 800:
+            # small serial 0D systems (standalone or solved as Lagrange multiplier sub-problem) are stored dense (no sparse pattern overhead, LAPACK LU)
+            self.K = PETSc.Mat().createDense(size=(self.numdof,self.numdof), comm=self.comm_sq)
+        else: # 0D block is merged into the monolithic (sparse) system, or 0D system is too large for dense storage
             self.K = PETSc.Mat().create(comm=self.comm_sq)
             self.K.setType(PETSc.Mat.Type.SEQAIJ)
             self.K.setSizes(size=(self.numdof,self.numdof))
@@ -164,6 +161,36 @@ class Flow0DProblem(problem_base):
         # initialize flow0d time-integration class
         self.ti = timeintegration.timeintegration_flow0d(time_params, self.pbase.dt, self.pbase.numstep, time_curves, self.pbase.t_init, comm=self.comm)
 
+        # time curve functions (resolved once here, since they are evaluated every time step or Newton iteration)
+        self.excitation_funcs = []
+        if self.excitation_curve is not None:
+            for i in range(len(self.excitation_curve)):
+                self.excitation_funcs.append(self.ti.timecurves(self.excitation_curve[i]))
+        self.chamber_funcs = {}
+        # activation descriptors (target in c, index, time curve) - activation/elastance goes to y[i], prescribed chamber values to c[len_c_3d0d+ci]
+        self.activation_descr = []
+        if bool(self.chamber_models):
+            ci=0
+            for i, ch in enumerate(['lv','rv','la','ra']):
+                if self.chamber_models[ch]['type']=='0D_elast':
+                    self.chamber_funcs[ch] = self.ti.timecurves(self.chamber_models[ch]['activation_curve'])
+                    self.activation_descr.append((False, i, self.chamber_funcs[ch]))
+                    ci+=1
+                if self.chamber_models[ch]['type']=='0D_elast_prescr':
+                    self.chamber_funcs[ch] = self.ti.timecurves(self.chamber_models[ch]['elastance_curve'])
+                    self.activation_descr.append((False, i, self.chamber_funcs[ch]))
+                    ci+=1
+                if self.chamber_models[ch]['type']=='0D_prescr':
+                    self.chamber_funcs[ch] = self.ti.timecurves(self.chamber_models[ch]['prescribed_curve'])
+                    self.activation_descr.append((True, ci, self.chamber_funcs[ch]))
+                    ci+=1
+        # indices and values of prescribed variables
+        self.prescribed_ids = np.array([self.cardvasc0D.varmap[a] for a in self.prescribed_variables], dtype=PETSc.IntType)
+        self.prescribed_vals = np.zeros(len(self.prescribed_variables))
+        self.prescribed_funcs = {}
+        for a in self.prescribed_variables:
+            if 'curve' in self.prescribed_variables[a]: self.prescribed_funcs[a] = self.ti.timecurves(self.prescribed_variables[a]['curve'])
+
         if initial_file:
             self.initialconditions = self.cardvasc0D.set_initial_from_file(initial_file)
         else:
@@ -191,7 +218,7 @@ class Flow0DProblem(problem_base):
 
         self.cardvasc0D.evaluate(self.s, t, self.df, self.f, None, None, self.c, self.y, self.aux)
 
-        theta = self.theta0d_timint(t)
+        theta, dt_inv = self.theta0d_timint(t), 1./self.pbase.dt
 
         self.df.assemble(), self.df_old.assemble()
         self.f.assemble(), self.f_old.assemble()
@@ -199,29 +226,23 @@ class Flow0DProblem(problem_base):
         # 0D rhs vector: r = (df - df_old)/dt + theta * f + (1-theta) * f_old
         self.r.zeroEntries()
 
-        self.r.axpy(1./self.pbase.dt, self.df)
-        self.r.axpy(-1./self.pbase.dt, self.df_old)
-
-        self.r.axpy(theta, self.f)
-        self.r.axpy(1.-theta, self.f_old)
+        self.r.maxpy([dt_inv, -dt_inv, theta, 1.-theta], [self.df, self.df_old, self.f, self.f_old])
 
         # if we have prescribed variable values over time
         if bool(self.prescribed_variables):
-            for a in self.prescribed_variables:
-                varindex = self.cardvasc0D.varmap[a]
+            for k, a in enumerate(self.prescribed_variables):
                 prescr = self.prescribed_variables[a]
                 prtype = list(prescr.keys())[0]
                 if prtype=='val':
-                    val = prescr['val']
+                    self.prescribed_vals[k] = prescr['val']
                 elif prtype=='curve':
-                    curvenumber = prescr['curve']
-                    val = self.ti.timecurves(curvenumber)(t)
+                    self.prescribed_vals[k] = self.prescribed_funcs[a](t)
                 elif prtype=='flux_monitor':
                     monid = prescr['flux_monitor']
-                    val = self.auxdata['q'][monid]
+                    self.prescribed_vals[k] = self.auxdata['q'][monid]
                 else:
                     raise ValueError("Unknown type to prescribe a variable.")
-                self.cardvasc0D.set_prescribed_variables_residual(self.s, self.r, val, varindex)
+            self.cardvasc0D.set_prescribed_variables_residual(self.s, self.r, self.prescribed_vals, self.prescribed_ids)
 
         self.r_list[0] = self.r
 
@@ -230,21 +251,19 @@ class Flow0DProblem(problem_base):
 
         self.cardvasc0D.evaluate(self.s, t, None, None, self.dK_, self.K_, self.c, self.y, self.aux)
 
-        theta = self.theta0d_timint(t)
+        theta, dt_inv = self.theta0d_timint(t), 1./self.pbase.dt
 
         self.dK_.assemble()
         self.K_.assemble()
         self.K.assemble()
 
         self.K.zeroEntries()
-        self.K.axpy(1./self.pbase.dt, self.dK_)
-        self.K.axpy(theta, self.K_)
+        self.K.axpy(dt_inv, self.dK_)
+        self.K.axpy(theta, self.K_, structure=PETSc.Mat.Structure.SAME_NONZERO_PATTERN) # dK_ and K_ are filled as the same (dense) block
 
         # if we have prescribed variable values over time
         if bool(self.prescribed_variables):
-            for a in self.prescribed_variables:
-                varindex = self.cardvasc0D.varmap[a]
-                self.cardvasc0D.set_prescribed_variables_stiffness(self.K, varindex)
+            self.cardvasc0D.set_prescribed_variables_stiffness(self.K, self.prescribed_ids)
 
         self.K_list[0][0] = self.K
 
@@ -295,8 +314,8 @@ class Flow0DProblem(problem_base):
         if ms: self.cardvasc0D.read_restart(self.output_path_0D, sname+'_s_set', rst, self.s_set)
 
         if self.cardvasc0D.T_cycl > 0: # read heart cycle info
-            self.ti.cycle[0] = np.loadtxt(self.output_path_0D+'/checkpoint_'+sname+'_cycledata_'+str(rst)+'.txt', usecols=(0), dtype=int)
-            self.ti.cycleerror[0] = np.loadtxt(self.output_path_0D+'/checkpoint_'+sname+'_cycledata_'+str(rst)+'.txt', usecols=(1), dtype=float)
+            cycledata = np.loadtxt(self.output_path_0D+'/checkpoint_'+sname+'_cycledata_'+str(rst)+'.txt')
+            self.ti.cycle[0], self.ti.cycleerror[0] = int(cycledata[0]), float(cycledata[1])
             self.pbase.t_init -= (self.ti.cycle[0]-1) * self.cardvasc0D.T_cycl
 
         if bool(self.auxdata_old):
@@ -309,18 +328,9 @@ class Flow0DProblem(problem_base):
     def evaluate_activation(self, t):
 
         # activation curves
-        if bool(self.chamber_models):
-            ci=0
-            for i, ch in enumerate(['lv','rv','la','ra']):
-                if self.chamber_models[ch]['type']=='0D_elast':
-                    self.y[i] = self.ti.timecurves(self.chamber_models[ch]['activation_curve'])(t)
-                    ci+=1
-                if self.chamber_models[ch]['type']=='0D_elast_prescr':
-                    self.y[i] = self.ti.timecurves(self.chamber_models[ch]['elastance_curve'])(t)
-                    ci+=1
-                if self.chamber_models[ch]['type']=='0D_prescr':
-                    self.c[self.len_c_3d0d+ci] = self.ti.timecurves(self.chamber_models[ch]['prescribed_curve'])(t)
-                    ci+=1
+        for in_c, idx, func in self.activation_descr:
+            if in_c: self.c[self.len_c_3d0d+idx] = func(t)
+            else: self.y[idx] = func(t)
 
 
     def induce_perturbation(self):
@@ -346,14 +356,13 @@ class Flow0DProblem(problem_base):
     def evaluate_initial(self):
 
         # evaluate old state
-        if self.excitation_curve is not None:
-            for i in range(len(self.excitation_curve)):
-                self.c.append(self.ti.timecurves(self.excitation_curve[i])(self.pbase.t_init))
+        for i in range(len(self.excitation_funcs)):
+            self.c.append(self.excitation_funcs[i](self.pbase.t_init))
         if bool(self.chamber_models):
             for i, ch in enumerate(['lv','rv','la','ra']):
-                if self.chamber_models[ch]['type']=='0D_elast': self.y[i] = self.ti.timecurves(self.chamber_models[ch]['activation_curve'])(self.pbase.t_init)
-                if self.chamber_models[ch]['type']=='0D_elast_prescr': self.y[i] = self.ti.timecurves(self.chamber_models[ch]['elastance_curve'])(self.pbase.t_init)
-                if self.chamber_models[ch]['type']=='0D_prescr': self.c.append(self.ti.timecurves(self.chamber_models[ch]['prescribed_curve'])(self.pbase.t_init))
+                if self.chamber_models[ch]['type']=='0D_elast': self.y[i] = self.chamber_funcs[ch](self.pbase.t_init)
+                if self.chamber_models[ch]['type']=='0D_elast_prescr': self.y[i] = self.chamber_funcs[ch](self.pbase.t_init)
+                if self.chamber_models[ch]['type']=='0D_prescr': self.c.append(self.chamber_funcs[ch](self.pbase.t_init))
 
         # if we have prescribed variable values over time
         if self.pbase.restart_step==0: # we read s and s_old in case of restart
@@ -365,8 +374,7 @@ class Flow0DProblem(problem_base):
                     if prtype=='val':
                         val = prescr['val']
                     elif prtype=='curve':
-                        curvenumber = prescr['curve']
-                        val = self.ti.timecurves(curvenumber)(self.pbase.t_init)
+                        val = self.prescribed_funcs[a](self.pbase.t_init)
                     else:
                         raise ValueError("Unknown type to prescribe a variable.")
                     self.s[varindex], self.s_old[varindex] = val, val
@@ -386,9 +394,8 @@ class Flow0DProblem(problem_base):
     def evaluate_pre_solve(self, t, N, dt):
 
         # external volume/flux from time curve
-        if self.excitation_curve is not None:
-            for i in range(len(self.excitation_curve)):
-                self.c[i] = self.ti.timecurves(self.excitation_curve[i])(t)
+        for i in range(len(self.excitation_funcs)):
+            self.c[i] = self.excitation_funcs[i](t)
         # activation curves
         self.evaluate_activation(t)
 
@@ -461,6 +468,8 @@ class Flow0DProblem(problem_base):
         self.dK_.destroy()
         self.K_.destroy()
 
+        self.cardvasc0D.close_output()
+
 
 
 class Flow0DSolver(solver_base):
@@ -49,6 +49,8 @@ class FluidmechanicsProblem(problem_base):
         self.problem_physics = 'fluid'
 
         self.results_to_write = io_params['results_to_write']
+        # post-processing (scalar) forms - compiled once on first use
+        self.postproc_forms = {}
 
         self.io = iof
 
@@ -818,7 +820,7 @@ class FluidmechanicsProblem(problem_base):
     def evaluate_active_stress(self):
 
         # project and interpolate to quadrature function space
-        tau_a_proj = project(self.tau_a_, self.Vd_scalar, self.dx, domids=self.domain_ids, comm=self.comm, entity_maps=self.io.entity_maps) # TODO: Should be self.ds here, but yields error; why?
+        tau_a_proj = project(self.tau_a_, self.Vd_scalar, self.dx, domids=self.domain_ids, comm=self.comm, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options) # TODO: Should be self.ds here, but yields error; why?
         self.tau_a.x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
         self.tau_a.interpolate(tau_a_proj)
 
@@ -826,13 +828,15 @@ class FluidmechanicsProblem(problem_base):
     # computes the fluid's total internal power
     def compute_power(self, N, t):
 
-        ip_all = ufl.as_ufl(0)
-        for n, M in enumerate(self.domain_ids):
-            if self.num_dupl==1: j=0
-            else: j=n
-            ip_all += ufl.inner(self.ma[n].sigma(self.v, self.p_[j], F=self.alevar['Fale']), self.ki.gamma(self.v, F=self.alevar['Fale'])) * self.dx(M)
+        if 'internalpower' not in self.postproc_forms:
+            ip_all = ufl.as_ufl(0)
+            for n, M in enumerate(self.domain_ids):
+                if self.num_dupl==1: j=0
+                else: j=n
+                ip_all += ufl.inner(self.ma[n].sigma(self.v, self.p_[j], F=self.alevar['Fale']), self.ki.gamma(self.v, F=self.alevar['Fale'])) * self.dx(M)
+            self.postproc_forms['internalpower'] = fem.form(ip_all, jit_options=self.io.jit_options)
 
-        ip = fem.assemble_scalar(fem.form(ip_all))
+        ip = fem.assemble_scalar(self.postproc_forms['internalpower'])
         ip = self.comm.allgather(ip)
         internal_power = sum(ip)
 
@@ -848,24 +852,27 @@ class FluidmechanicsProblem(problem_base):
     # computes the total strain energy and internal power of a membrane (reduced) solid model
     def compute_strain_energy_power_membrane(self, N, t):
 
-        se_mem_all, ip_mem_all = ufl.as_ufl(0), ufl.as_ufl(0)
-        for nm in range(len(self.bc_dict['membrane'])):
+        if 'strainenergy_membrane' not in self.postproc_forms:
+            se_mem_all, ip_mem_all = ufl.as_ufl(0), ufl.as_ufl(0)
+            for nm in range(len(self.bc_dict['membrane'])):
 
-            internal = self.bc_dict['membrane'][nm].get('internal', False)
+                internal = self.bc_dict['membrane'][nm].get('internal', False)
 
-            if internal:
-                fcts = self.bc_dict['membrane'][nm].get('facet_side', '+')
-                se_mem_all += (self.bstrainenergy[nm])(fcts) * self.bmeasures[2](self.idmem[nm])
-                ip_mem_all += (self.bintpower[nm])(fcts) * self.bmeasures[2](self.idmem[nm])
-            else:
-                se_mem_all += self.bstrainenergy[nm] * self.bmeasures[0](self.idmem[nm])
-                ip_mem_all += self.bintpower[nm] * self.bmeasures[0](self.idmem[nm])
+                if internal:
+                    fcts = self.bc_dict['membrane'][nm].get('facet_side', '+')
+                    se_mem_all += (self.bstrainenergy[nm])(fcts) * self.bmeasures[2](self.idmem[nm])
+                    ip_mem_all += (self.bintpower[nm])(fcts) * self.bmeasures[2](self.idmem[nm])
+                else:
+                    se_mem_all += self.bstrainenergy[nm] * self.bmeasures[0](self.idmem[nm])
+                    ip_mem_all += self.bintpower[nm] * self.bmeasures[0](self.idmem[nm])
+
+            self.postproc_forms['strainenergy_membrane'], self.postproc_forms['internalpower_membrane'] = fem.form(se_mem_all, jit_options=self.io.jit_options), fem.form(ip_mem_all, jit_options=self.io.jit_options)
 
-        se_mem = fem.assemble_scalar(fem.form(se_mem_all))
+        se_mem = fem.assemble_scalar(self.postproc_forms['strainenergy_membrane'])
         se_mem = self.comm.allgather(se_mem)
         strain_energy_mem = sum(se_mem)
 
-        ip_mem = fem.assemble_scalar(fem.form(ip_mem_all))
+        ip_mem = fem.assemble_scalar(self.postproc_forms['internalpower_membrane'])
         ip_mem = self.comm.allgather(ip_mem)
         internal_power_mem = sum(ip_mem)
 
@@ -911,11 +918,11 @@ class FluidmechanicsProblem(problem_base):
                     self.weakform_lin_prestress_pp = sum(self.weakform_lin_prestress_pp)
 
         if not pre:
-            self.res_v = fem.form(self.weakform_v, entity_maps=self.io.entity_maps)
-            self.res_p = fem.form(self.weakform_p, entity_maps=self.io.entity_maps)
-            self.jac_vv = fem.form(self.weakform_lin_vv, entity_maps=self.io.entity_maps)
-            self.jac_vp = fem.form(self.weakform_lin_vp, entity_maps=self.io.entity_maps)
-            self.jac_pv = fem.form(self.weakform_lin_pv, entity_maps=self.io.entity_maps)
+            self.res_v = fem.form(self.weakform_v, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+            self.res_p = fem.form(self.weakform_p, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+            self.jac_vv = fem.form(self.weakform_lin_vv, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+            self.jac_vp = fem.form(self.weakform_lin_vp, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+            self.jac_pv = fem.form(self.weakform_lin_pv, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
             if self.num_dupl > 1:
                 self.dummat = [[None]*self.num_dupl for _ in range(self.num_dupl)] # needed for block vector assembly...
                 # make lists for offdiagonal block mat assembly
@@ -924,17 +931,17 @@ class FluidmechanicsProblem(problem_base):
                 for j in range(self.num_dupl):
                     self.jac_pv_.append([self.jac_pv[j]])
             if self.stabilization is not None:
-                self.jac_pp = fem.form(self.weakform_lin_pp, entity_maps=self.io.entity_maps)
+                self.jac_pp = fem.form(self.weakform_lin_pp, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
                 if self.num_dupl > 1:
                     self.jac_pp_ = [[None]*self.num_dupl for _ in range(self.num_dupl)]
                     for j in range(self.num_dupl):
                         self.jac_pp_[j][j] = self.jac_pp[j]
         else:
-            self.res_v  = fem.form(self.weakform_prestress_v, entity_maps=self.io.entity_maps)
-            self.res_p  = fem.form(self.weakform_prestress_p, entity_maps=self.io.entity_maps)
-            self.jac_vv = fem.form(self.weakform_lin_prestress_vv, entity_maps=self.io.entity_maps)
-            self.jac_vp = fem.form(self.weakform_lin_prestress_vp, entity_maps=self.io.entity_maps)
-            self.jac_pv = fem.form(self.weakform_lin_prestress_pv, entity_maps=self.io.entity_maps)
+            self.res_v  = fem.form(self.weakform_prestress_v, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+            self.res_p  = fem.form(self.weakform_prestress_p, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+            self.jac_vv = fem.form(self.weakform_lin_prestress_vv, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+            self.jac_vp = fem.form(self.weakform_lin_prestress_vp, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+            self.jac_pv = fem.form(self.weakform_lin_prestress_pv, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
             if self.num_dupl > 1:
                 self.dummat = [[None]*self.num_dupl for _ in range(self.num_dupl)] # needed for block vector assembly...
                 # make lists for offdiagonal block mat assembly
@@ -943,7 +950,7 @@ class FluidmechanicsProblem(problem_base):
                 for j in range(self.num_dupl):
                     self.jac_pv_.append([self.jac_pv[j]])
             if self.stabilization is not None:
-                self.jac_pp = fem.form(self.weakform_lin_prestress_pp, entity_maps=self.io.entity_maps)
+                self.jac_pp = fem.form(self.weakform_lin_prestress_pp, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
                 if self.num_dupl > 1:
                     self.jac_pp_ = [[None]*self.num_dupl for _ in range(self.num_dupl)]
                     for j in range(self.num_dupl):
@@ -952,7 +959,7 @@ class FluidmechanicsProblem(problem_base):
         if self.have_robin_valve_implicit:
             self.dw_robin_valve_dz_form, self.drz_dp = [], []
             for i in range(self.num_valve_coupling_surf):
-                self.dw_robin_valve_dz_form.append(fem.form(self.dw_robin_valve_dz[i], entity_maps=self.io.entity_maps))
+                self.dw_robin_valve_dz_form.append(fem.form(self.dw_robin_valve_dz[i], entity_maps=self.io.entity_maps, jit_options=self.io.jit_options))
 
         te = time.time() - ts
         utilities.print_status("t = %.4f s" % (te), self.comm)
@@ -1125,7 +1132,7 @@ class FluidmechanicsProblem(problem_base):
             for i in range(len(self.col_ids)):
                 # NOTE: only set the surface-subset of the k_vz vector entries to avoid placing unnecessary zeros!
                 self.k_vz_vec[i].getSubVector(self.dofs_coupling_v[i], subvec=self.k_vz_subvec[i])
-                self.K_vz.setValues(self.dofs_coupling_v[i], self.col_ids[i], self.k_vz_subvec[i].array, addv=PETSc.InsertMode.INSERT)
+                self.K_vz.setValues(self.dofs_coupling_v[i], self.col_ids[i], self.k_vz_subvec[i].array_r, addv=PETSc.InsertMode.INSERT)
                 self.k_vz_vec[i].restoreSubVector(self.dofs_coupling_v[i], subvec=self.k_vz_subvec[i])
 
             self.K_vz.assemble()
@@ -1315,7 +1322,7 @@ class FluidmechanicsProblem(problem_base):
 
         if 'fibers' in self.results_to_write and self.io.write_results_every > 0:
             for i in range(len(self.fibarray)):
-                fib_proj = project(self.fib_func[i], self.V_v, self.dx, domids=self.domain_ids, nm='Fiber'+str(i+1), comm=self.comm, entity_maps=self.io.entity_maps)
+                fib_proj = project(self.fib_func[i], self.V_v, self.dx, domids=self.domain_ids, nm='Fiber'+str(i+1), comm=self.comm, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
                 self.io.write_output_pre(self, fib_proj, 0.0, 'fib_'+self.fibarray[i])
 
 
@@ -1422,7 +1429,7 @@ class FluidmechanicsSolver(solver_base):
             weakform_lin_aa = ufl.derivative(weakform_a, self.pb.a_old, self.pb.dv) # actually linear in a_old
 
             # solve for consistent initial acceleration a_old
-            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.io.entity_maps), fem.form(weakform_lin_aa, entity_maps=self.pb.io.entity_maps)
+            res_a, jac_aa  = fem.form(weakform_a, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options), fem.form(weakform_lin_aa, entity_maps=self.pb.io.entity_maps, jit_options=self.pb.io.jit_options)
             self.solnln.solve_consistent_ini_acc(res_a, jac_aa, self.pb.a_old)
 
             te = time.time() - ts
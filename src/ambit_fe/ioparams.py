@@ -16,6 +16,8 @@ def check_params_io(params):
                     'gridname_domain',
                     'gridname_boundary',
                     'indicate_results_by',
+                    'jit_cache_dir',
+                    'jit_compile_args',
                     'mesh_dim',
                     'mesh_domain',
                     'mesh_boundary',
@@ -60,6 +62,8 @@ def check_params_solver(params):
                     'lin_norm_type',
                     'max_liniter',
                     'maxiter',
+                    'mumps_cntl',
+                    'mumps_icntl',
                     'petsc_options_ksp',
                     'precond_fields',
                     'precond_fields_prestr',
@@ -54,6 +54,16 @@ class IO:
 
         self.print_enhanced_info = io_params.get('print_enhanced_info', False)
 
+        # OPTIONAL: fixed directory for the FFCx/CFFI JIT cache, so that compiled forms persist across runs (e.g. in containers or batch jobs), and extra compiler arguments for the generated kernels
+        # these are passed to the form compilation calls of this problem only (not set in dolfinx's global default JIT options)
+        self.jit_options = {}
+        self.jit_cache_dir = io_params.get('jit_cache_dir', None)
+        if self.jit_cache_dir is not None:
+            self.jit_options['cache_dir'] = self.jit_cache_dir
+        self.jit_compile_args = io_params.get('jit_compile_args', None)
+        if self.jit_compile_args is not None:
+            self.jit_options['cffi_extra_compile_args'] = self.jit_compile_args
+
         # TODO: Currently, for coupled problems, all append to this dict, so output names should not conflict... hence, make this problem-specific!
         self.resultsfiles = {}
 
@@ -397,7 +407,7 @@ class IO:
 
             # project to fiber function space
             if self.order_fib_input != order_disp:
-                fib_func.append( project(fib_func_input[si], V_fib, dx_, domids=domids, nm='Fiber'+str(si+1), comm=self.comm, entity_maps=self.entity_maps) )
+                fib_func.append( project(fib_func_input[si], V_fib, dx_, domids=domids, nm='Fiber'+str(si+1), comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options) )
             else:
                 fib_func.append( fib_func_input[si] )
 
@@ -476,12 +486,12 @@ class IO_solid(IO):
                         u_out.interpolate(pb.u)
                         self.resultsfiles[res].write_function(u_out, indicator)
                     elif res=='velocity': # passed in v is not a function but form, so we have to project
-                        self.v_proj = project(pb.vel, pb.V_u, pb.dx, domids=pb.domain_ids, nm="Velocity", comm=self.comm, entity_maps=self.entity_maps) # class variable for testing
+                        self.v_proj = project(pb.vel, pb.V_u, pb.dx, domids=pb.domain_ids, nm="Velocity", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options) # class variable for testing
                         v_out = fem.Function(pb.V_out_vector, name=self.v_proj.name)
                         v_out.interpolate(self.v_proj)
                         self.resultsfiles[res].write_function(v_out, indicator)
                     elif res=='acceleration': # passed in a is not a function but form, so we have to project
-                        self.a_proj = project(pb.acc, pb.V_u, pb.dx, domids=pb.domain_ids, nm="Acceleration", comm=self.comm, entity_maps=self.entity_maps) # class variable for testing
+                        self.a_proj = project(pb.acc, pb.V_u, pb.dx, domids=pb.domain_ids, nm="Acceleration", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options) # class variable for testing
                         a_out = fem.Function(pb.V_out_vector, name=self.a_proj.name)
                         a_out.interpolate(self.a_proj)
                         self.resultsfiles[res].write_function(a_out, indicator)
@@ -493,7 +503,7 @@ class IO_solid(IO):
                         stressfuncs=[]
                         for n in range(pb.num_domains):
                             stressfuncs.append(pb.ma[n].sigma(pb.u,pb.p,pb.vel,ivar=pb.internalvars))
-                        cauchystress = project(stressfuncs, pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="CauchyStress", comm=self.comm, entity_maps=self.entity_maps)
+                        cauchystress = project(stressfuncs, pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="CauchyStress", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         cauchystress_out = fem.Function(pb.V_out_tensor, name=cauchystress.name)
                         cauchystress_out.interpolate(cauchystress)
                         self.resultsfiles[res].write_function(cauchystress_out, indicator)
@@ -501,7 +511,7 @@ class IO_solid(IO):
                         stressfuncs=[]
                         for n in range(pb.num_domains):
                             stressfuncs.append(pb.ma[n].sigma(pb.u,pb.p,pb.vel,ivar=pb.internalvars))
-                        cauchystress_nodal = project(stressfuncs, pb.V_tensor, pb.dx, domids=pb.domain_ids, nm="CauchyStress_nodal", comm=self.comm, entity_maps=self.entity_maps)
+                        cauchystress_nodal = project(stressfuncs, pb.V_tensor, pb.dx, domids=pb.domain_ids, nm="CauchyStress_nodal", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         cauchystress_nodal_out = fem.Function(pb.V_out_tensor, name=cauchystress_nodal.name)
                         cauchystress_nodal_out.interpolate(cauchystress_nodal)
                         self.resultsfiles[res].write_function(cauchystress_nodal_out, indicator)
@@ -510,7 +520,7 @@ class IO_solid(IO):
                         for n in range(pb.num_domains):
                             evals, _, _ = spectral_decomposition_3x3(pb.ma[n].sigma(pb.u,pb.p,pb.vel,ivar=pb.internalvars))
                             stressfuncs_eval.append(ufl.as_vector(evals)) # written as vector
-                        cauchystress_principal = project(stressfuncs_eval, pb.Vd_vector, pb.dx, domids=pb.domain_ids, nm="CauchyStress_princ", comm=self.comm, entity_maps=self.entity_maps)
+                        cauchystress_principal = project(stressfuncs_eval, pb.Vd_vector, pb.dx, domids=pb.domain_ids, nm="CauchyStress_princ", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         cauchystress_principal_out = fem.Function(pb.V_out_vector, name=cauchystress_principal.name)
                         cauchystress_principal_out.interpolate(cauchystress_principal)
                         self.resultsfiles[res].write_function(cauchystress_principal_out, indicator)
@@ -518,7 +528,7 @@ class IO_solid(IO):
                         stressfuncs=[]
                         for n in range(len(pb.bstress)):
                             stressfuncs.append(pb.bstress[n])
-                        cauchystress_membrane = project(stressfuncs, pb.Vd_tensor, pb.bmeasures[0], domids=pb.idmem, nm="CauchyStress_membrane", comm=self.comm, entity_maps=self.entity_maps)
+                        cauchystress_membrane = project(stressfuncs, pb.Vd_tensor, pb.bmeasures[0], domids=pb.idmem, nm="CauchyStress_membrane", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         cauchystress_membrane_out = fem.Function(pb.V_out_tensor, name=cauchystress_membrane.name)
                         cauchystress_membrane_out.interpolate(cauchystress_membrane)
                         self.resultsfiles[res].write_function(cauchystress_membrane_out, indicator)
@@ -527,7 +537,7 @@ class IO_solid(IO):
                         for n in range(len(pb.bstress)):
                             evals, _, _ = spectral_decomposition_3x3(pb.bstress[n])
                             stressfuncs.append(ufl.as_vector(evals)) # written as vector
-                        self.cauchystress_membrane_principal = project(stressfuncs, pb.Vd_vector, pb.bmeasures[0], domids=pb.idmem, nm="CauchyStress_membrane_princ", comm=self.comm, entity_maps=self.entity_maps)
+                        self.cauchystress_membrane_principal = project(stressfuncs, pb.Vd_vector, pb.bmeasures[0], domids=pb.idmem, nm="CauchyStress_membrane_princ", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         cauchystress_membrane_principal_out = fem.Function(pb.V_out_vector, name=self.cauchystress_membrane_principal.name)
                         cauchystress_membrane_principal_out.interpolate(self.cauchystress_membrane_principal)
                         self.resultsfiles[res].write_function(cauchystress_membrane_principal_out, indicator)
@@ -535,7 +545,7 @@ class IO_solid(IO):
                         sefuncs=[]
                         for n in range(len(pb.bstrainenergy)):
                             sefuncs.append(pb.bstrainenergy[n])
-                        strainenergy_membrane = project(sefuncs, pb.Vd_scalar, pb.bmeasures[0], domids=pb.idmem, nm="StrainEnergy_membrane", comm=self.comm, entity_maps=self.entity_maps)
+                        strainenergy_membrane = project(sefuncs, pb.Vd_scalar, pb.bmeasures[0], domids=pb.idmem, nm="StrainEnergy_membrane", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         strainenergy_membrane_out = fem.Function(pb.V_out_scalar, name=strainenergy_membrane.name)
                         strainenergy_membrane_out.interpolate(strainenergy_membrane)
                         self.resultsfiles[res].write_function(strainenergy_membrane_out, indicator)
@@ -543,7 +553,7 @@ class IO_solid(IO):
                         pwfuncs=[]
                         for n in range(len(pb.bintpower)):
                             pwfuncs.append(pb.bintpower[n])
-                        internalpower_membrane = project(pwfuncs, pb.Vd_scalar, pb.bmeasures[0], domids=pb.idmem, nm="InternalPower_membrane", comm=self.comm, entity_maps=self.entity_maps)
+                        internalpower_membrane = project(pwfuncs, pb.Vd_scalar, pb.bmeasures[0], domids=pb.idmem, nm="InternalPower_membrane", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         internalpower_membrane_out = fem.Function(pb.V_out_scalar, name=internalpower_membrane.name)
                         internalpower_membrane_out.interpolate(internalpower_membrane)
                         self.resultsfiles[res].write_function(internalpower_membrane_out, indicator)
@@ -551,7 +561,7 @@ class IO_solid(IO):
                         stressfuncs=[]
                         for n in range(pb.num_domains):
                             stressfuncs.append(tr(pb.ma[n].M(pb.u,pb.p,pb.vel,ivar=pb.internalvars)))
-                        trmandelstress = project(stressfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="trMandelStress", comm=self.comm, entity_maps=self.entity_maps)
+                        trmandelstress = project(stressfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="trMandelStress", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         trmandelstress_out = fem.Function(pb.V_out_scalar, name=trmandelstress.name)
                         trmandelstress_out.interpolate(trmandelstress)
                         self.resultsfiles[res].write_function(trmandelstress_out, indicator)
@@ -560,7 +570,7 @@ class IO_solid(IO):
                         for n in range(pb.num_domains):
                             if pb.mat_growth[n]: stressfuncs.append(tr(pb.ma[n].M_e(pb.u,pb.p,pb.vel,pb.ki.C(pb.u),ivar=pb.internalvars)))
                             else: stressfuncs.append(ufl.as_ufl(0))
-                        trmandelstress_e = project(stressfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="trMandelStress_e", comm=self.comm, entity_maps=self.entity_maps)
+                        trmandelstress_e = project(stressfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="trMandelStress_e", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         trmandelstress_e_out = fem.Function(pb.V_out_scalar, name=trmandelstress_e.name)
                         trmandelstress_e_out.interpolate(trmandelstress_e)
                         self.resultsfiles[res].write_function(trmandelstress_e_out, indicator)
@@ -568,7 +578,7 @@ class IO_solid(IO):
                         stressfuncs=[]
                         for n in range(pb.num_domains):
                             stressfuncs.append(pb.ma[n].sigma_vonmises(pb.u,pb.p,pb.vel,ivar=pb.internalvars))
-                        vonmises_cauchystress = project(stressfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="vonMises_CauchyStress", comm=self.comm, entity_maps=self.entity_maps)
+                        vonmises_cauchystress = project(stressfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="vonMises_CauchyStress", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         vonmises_cauchystress_out = fem.Function(pb.V_out_scalar, name=vonmises_cauchystress.name)
                         vonmises_cauchystress_out.interpolate(vonmises_cauchystress)
                         self.resultsfiles[res].write_function(vonmises_cauchystress_out, indicator)
@@ -576,7 +586,7 @@ class IO_solid(IO):
                         stressfuncs=[]
                         for n in range(pb.num_domains):
                             stressfuncs.append(pb.ma[n].P(pb.u,pb.p,pb.vel,ivar=pb.internalvars))
-                        pk1stress = project(stressfuncs, pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="PK1Stress", comm=self.comm, entity_maps=self.entity_maps)
+                        pk1stress = project(stressfuncs, pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="PK1Stress", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         pk1stress_out = fem.Function(pb.V_out_tensor, name=pk1stress.name)
                         pk1stress_out.interpolate(pk1stress)
                         self.resultsfiles[res].write_function(pk1stress_out, indicator)
@@ -584,36 +594,36 @@ class IO_solid(IO):
                         stressfuncs=[]
                         for n in range(pb.num_domains):
                             stressfuncs.append(pb.ma[n].S(pb.u,pb.p,pb.vel,ivar=pb.internalvars))
-                        pk2stress = project(stressfuncs, pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="PK2Stress", comm=self.comm, entity_maps=self.entity_maps)
+                        pk2stress = project(stressfuncs, pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="PK2Stress", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         pk2stress_out = fem.Function(pb.V_out_tensor, name=pk2stress.name)
                         pk2stress_out.interpolate(pk2stress)
                         self.resultsfiles[res].write_function(pk2stress_out, indicator)
                     elif res=='jacobian':
-                        jacobian = project(pb.ki.J(pb.u), pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="Jacobian", comm=self.comm, entity_maps=self.entity_maps)
+                        jacobian = project(pb.ki.J(pb.u), pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="Jacobian", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         jacobian_out = fem.Function(pb.V_out_scalar, name=jacobian.name)
                         jacobian_out.interpolate(jacobian)
                         self.resultsfiles[res].write_function(jacobian_out, indicator)
                     elif res=='glstrain':
-                        glstrain = project(pb.ki.E(pb.u), pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="GreenLagrangeStrain", comm=self.comm, entity_maps=self.entity_maps)
+                        glstrain = project(pb.ki.E(pb.u), pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="GreenLagrangeStrain", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         glstrain_out = fem.Function(pb.V_out_tensor, name=glstrain.name)
                         glstrain_out.interpolate(glstrain)
                         self.resultsfiles[res].write_function(glstrain_out, indicator)
                     elif res=='glstrain_principal':
                         evals, _, _ = spectral_decomposition_3x3(pb.ki.E(pb.u))
                         evals_gl = ufl.as_vector(evals) # written as vector
-                        glstrain_principal = project(evals_gl, pb.Vd_vector, pb.dx, domids=pb.domain_ids, nm="GreenLagrangeStrain_princ", comm=self.comm, entity_maps=self.entity_maps)
+                        glstrain_principal = project(evals_gl, pb.Vd_vector, pb.dx, domids=pb.domain_ids, nm="GreenLagrangeStrain_princ", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         glstrain_principal_out = fem.Function(pb.V_out_vector, name=glstrain_principal.name)
                         glstrain_principal_out.interpolate(glstrain_principal)
                         self.resultsfiles[res].write_function(glstrain_principal_out, indicator)
                     elif res=='eastrain':
-                        eastrain = project(pb.ki.e(pb.u), pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="EulerAlmansiStrain", comm=self.comm, entity_maps=self.entity_maps)
+                        eastrain = project(pb.ki.e(pb.u), pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="EulerAlmansiStrain", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         eastrain_out = fem.Function(pb.V_out_tensor, name=eastrain.name)
                         eastrain_out.interpolate(eastrain)
                         self.resultsfiles[res].write_function(eastrain_out, indicator)
                     elif res=='eastrain_principal':
                         evals, _, _ = spectral_decomposition_3x3(pb.ki.e(pb.u))
                         evals_ea = ufl.as_vector(evals) # written as vector
-                        eastrain_principal = project(evals_gl, pb.Vd_vector, pb.dx, domids=pb.domain_ids, nm="EulerAlmansiStrain_princ", comm=self.comm, entity_maps=self.entity_maps)
+                        eastrain_principal = project(evals_gl, pb.Vd_vector, pb.dx, domids=pb.domain_ids, nm="EulerAlmansiStrain_princ", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         eastrain_principal_out = fem.Function(pb.V_out_vector, name=eastrain_principal.name)
                         eastrain_principal_out.interpolate(eastrain_principal)
                         self.resultsfiles[res].write_function(eastrain_principal_out, indicator)
@@ -621,7 +631,7 @@ class IO_solid(IO):
                         sefuncs=[]
                         for n in range(pb.num_domains):
                             sefuncs.append(pb.ma[n].S(pb.u,pb.p,pb.vel,ivar=pb.internalvars,returnquantity='strainenergy'))
-                        se = project(sefuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="StrainEnergy", comm=self.comm, entity_maps=self.entity_maps)
+                        se = project(sefuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="StrainEnergy", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         se_out = fem.Function(pb.V_out_scalar, name=se.name)
                         se_out.interpolate(se)
                         self.resultsfiles[res].write_function(se_out, indicator)
@@ -629,12 +639,12 @@ class IO_solid(IO):
                         pwfuncs=[]
                         for n in range(pb.num_domains):
                             pwfuncs.append(ufl.inner(pb.ma[n].S(pb.u,pb.p,pb.vel,ivar=pb.internalvars),pb.ki.Edot(pb.u,pb.vel)))
-                        pw = project(pwfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="InternalPower", comm=self.comm, entity_maps=self.entity_maps)
+                        pw = project(pwfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="InternalPower", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         pw_out = fem.Function(pb.V_out_scalar, name=pw.name)
                         pw_out.interpolate(pw)
                         self.resultsfiles[res].write_function(pw_out, indicator)
                     elif res=='fiberstretch':
-                        fiberstretch = project(pb.ki.fibstretch(pb.u,pb.fib_func[0]), pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="FiberStretch", comm=self.comm, entity_maps=self.entity_maps)
+                        fiberstretch = project(pb.ki.fibstretch(pb.u,pb.fib_func[0]), pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="FiberStretch", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         fiberstretch_out = fem.Function(pb.V_out_scalar, name=fiberstretch.name)
                         fiberstretch_out.interpolate(fiberstretch)
                         self.resultsfiles[res].write_function(fiberstretch_out, indicator)
@@ -643,7 +653,7 @@ class IO_solid(IO):
                         for n in range(pb.num_domains):
                             if pb.mat_growth[n]: stretchfuncs.append(pb.ma[n].fibstretch_e(pb.ki.C(pb.u),pb.theta,pb.fib_func[0]))
                             else: stretchfuncs.append(ufl.as_ufl(0))
-                        fiberstretch_e = project(stretchfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="FiberStretch_e", comm=self.comm, entity_maps=self.entity_maps)
+                        fiberstretch_e = project(stretchfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="FiberStretch_e", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         fiberstretch_e_out = fem.Function(pb.V_out_scalar, name=fiberstretch_e.name)
                         fiberstretch_e_out.interpolate(fiberstretch_e)
                         self.resultsfiles[res].write_function(fiberstretch_e_out, indicator)
@@ -656,7 +666,7 @@ class IO_solid(IO):
                         for n in range(pb.num_domains):
                             if pb.mat_remodel[n]: phifuncs.append(pb.ma[n].phi_remod(pb.theta))
                             else: phifuncs.append(ufl.as_ufl(0))
-                        phiremod = project(phifuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="phiRemodel", comm=self.comm, entity_maps=self.entity_maps)
+                        phiremod = project(phifuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="phiRemodel", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         phiremod_out = fem.Function(pb.V_out_scalar, name=phiremod.name)
                         phiremod_out.interpolate(phiremod)
                         self.resultsfiles[res].write_function(phiremod_out, indicator)
@@ -815,7 +825,7 @@ class IO_fluid(IO):
                         v_out.interpolate(pb.v)
                         self.resultsfiles[res].write_function(v_out, indicator)
                     elif res=='acceleration': # passed in a is not a function but form, so we have to project
-                        a_proj = project(pb.acc, pb.V_v, pb.dx, domids=pb.domain_ids, nm="Acceleration", comm=self.comm, entity_maps=self.entity_maps)
+                        a_proj = project(pb.acc, pb.V_v, pb.dx, domids=pb.domain_ids, nm="Acceleration", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         a_out = fem.Function(pb.V_out_vector, name=a_proj.name)
                         a_out.interpolate(a_proj)
                         self.resultsfiles[res].write_function(a_out, indicator)
@@ -834,12 +844,12 @@ class IO_fluid(IO):
                         stressfuncs=[]
                         for n in range(pb.num_domains):
                             stressfuncs.append(pb.ma[n].sigma(pb.v,pb.p,F=pb.alevar['Fale']))
-                        cauchystress = project(stressfuncs, pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="CauchyStress", comm=self.comm, entity_maps=self.entity_maps)
+                        cauchystress = project(stressfuncs, pb.Vd_tensor, pb.dx, domids=pb.domain_ids, nm="CauchyStress", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         cauchystress_out = fem.Function(pb.V_out_tensor, name=cauchystress.name)
                         cauchystress_out.interpolate(cauchystress)
                         self.resultsfiles[res].write_function(cauchystress_out, indicator)
                     elif res=='fluiddisplacement': # passed in uf is not a function but form, so we have to project
-                        uf_proj = project(pb.ufluid, pb.V_v, pb.dx, domids=pb.domain_ids, nm="FluidDisplacement", comm=self.comm, entity_maps=self.entity_maps)
+                        uf_proj = project(pb.ufluid, pb.V_v, pb.dx, domids=pb.domain_ids, nm="FluidDisplacement", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         uf_out = fem.Function(pb.V_out_vector, name=uf_proj.name)
                         uf_out.interpolate(uf_proj)
                         self.resultsfiles[res].write_function(uf_out, indicator)
@@ -850,7 +860,7 @@ class IO_fluid(IO):
                         stressfuncs=[]
                         for n in range(len(pb.bstress)):
                             stressfuncs.append(pb.bstress[n])
-                        cauchystress_membrane = project(stressfuncs, pb.Vd_tensor, pb.bmeasures[0], domids=pb.idmem, nm="CauchyStress_membrane", comm=self.comm, entity_maps=self.entity_maps)
+                        cauchystress_membrane = project(stressfuncs, pb.Vd_tensor, pb.bmeasures[0], domids=pb.idmem, nm="CauchyStress_membrane", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         cauchystress_membrane_out = fem.Function(pb.V_out_tensor, name=cauchystress_membrane.name)
                         cauchystress_membrane_out.interpolate(cauchystress_membrane)
                         self.resultsfiles[res].write_function(cauchystress_membrane_out, indicator)
@@ -858,7 +868,7 @@ class IO_fluid(IO):
                         sefuncs=[]
                         for n in range(len(pb.bstrainenergy)):
                             sefuncs.append(pb.bstrainenergy[n])
-                        strainenergy_membrane = project(sefuncs, pb.Vd_scalar, pb.bmeasures[0], domids=pb.idmem, nm="StrainEnergy_membrane", comm=self.comm, entity_maps=self.entity_maps)
+                        strainenergy_membrane = project(sefuncs, pb.Vd_scalar, pb.bmeasures[0], domids=pb.idmem, nm="StrainEnergy_membrane", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         strainenergy_membrane_out = fem.Function(pb.V_out_scalar, name=strainenergy_membrane.name)
                         strainenergy_membrane_out.interpolate(strainenergy_membrane)
                         self.resultsfiles[res].write_function(strainenergy_membrane_out, indicator)
@@ -866,7 +876,7 @@ class IO_fluid(IO):
                         pwfuncs=[]
                         for n in range(len(pb.bintpower)):
                             pwfuncs.append(pb.bintpower[n])
-                        internalpower_membrane = project(pwfuncs, pb.Vd_scalar, pb.bmeasures[0], domids=pb.idmem, nm="InternalPower_membrane", comm=self.comm, entity_maps=self.entity_maps)
+                        internalpower_membrane = project(pwfuncs, pb.Vd_scalar, pb.bmeasures[0], domids=pb.idmem, nm="InternalPower_membrane", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         internalpower_membrane_out = fem.Function(pb.V_out_scalar, name=internalpower_membrane.name)
                         internalpower_membrane_out.interpolate(internalpower_membrane)
                         self.resultsfiles[res].write_function(internalpower_membrane_out, indicator)
@@ -874,7 +884,7 @@ class IO_fluid(IO):
                         pwfuncs=[]
                         for n in range(pb.num_domains):
                             pwfuncs.append(ufl.inner(pb.ma[n].sigma(pb.v,pb.p,F=pb.alevar['Fale']),pb.ki.gamma(pb.v,F=pb.alevar['Fale'])))
-                        pw = project(pwfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="InternalPower", comm=self.comm, entity_maps=self.entity_maps)
+                        pw = project(pwfuncs, pb.Vd_scalar, pb.dx, domids=pb.domain_ids, nm="InternalPower", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         pw_out = fem.Function(pb.V_out_scalar, name=pw.name)
                         pw_out.interpolate(pw)
                         self.resultsfiles[res].write_function(pw_out, indicator)
@@ -1011,7 +1021,7 @@ class IO_ale(IO):
                         d_out.interpolate(pb.d)
                         self.resultsfiles[res].write_function(d_out, indicator)
                     elif res=='alevelocity':
-                        w_proj = project(pb.wel, pb.V_d, pb.dx, domids=pb.domain_ids, nm="AleVelocity", comm=self.comm, entity_maps=self.entity_maps)
+                        w_proj = project(pb.wel, pb.V_d, pb.dx, domids=pb.domain_ids, nm="AleVelocity", comm=self.comm, entity_maps=self.entity_maps, jit_options=self.jit_options)
                         w_out = fem.Function(pb.V_out_vector, name=w_proj.name)
                         w_out.interpolate(w_proj)
                         self.resultsfiles[res].write_function(w_out, indicator)
@@ -32,22 +32,11 @@ def allgather_vec_entry(var, Id, comm):
 def allgather_vec(var, comm):
 
     var.assemble()
-    # ownership range of parallel vector
-    vs, ve = var.getOwnershipRange()
-
-    var_tmp, var_all = np.zeros(var.getSize()), np.zeros(var.getSize())
 
-    for i in range(vs,ve):
-        var_tmp[i] = var[i]
+    # gather the local parts - ownership ranges are contiguous and ordered by rank, so concatenation gives the global vector
+    var_arr = comm.allgather(var.array_r)
 
-    var_arr = comm.allgather(var_tmp)
-
-    for i in range(len(var_arr)):
-        var_all += var_arr[i]
-
-    del var_tmp
-
-    return var_all
+    return np.concatenate(var_arr)
 
 
 # gather a parallel PETSc matrix and store it to a numpy array known by all processes
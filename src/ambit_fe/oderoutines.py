@@ -9,6 +9,7 @@
 import sys, time
 import numpy as np
 import sympy as sp
+from petsc4py import PETSc
 
 from . import utilities
 from .mpiroutines import allgather_vec, allgather_vec_entry
@@ -24,55 +25,57 @@ class ode:
         self.varmap, self.auxmap = {}, {} # maps for primary and auxiliary variables
         self.ode_parallel = ode_par # if ODEs should have parallel or serial layout
         self.comm = comm # MPI communicator
+        self.outfiles = {} # open result files (kept open over the simulation)
+
+        # full array of a PETSc state vector on every process, depending on the layout (resolved once here)
+        if self.ode_parallel: self.gather_vec = lambda var: allgather_vec(var, self.comm)
+        else: self.gather_vec = lambda var: var.array
 
 
     # evaluate model at current nonlinear iteration
     def evaluate(self, x, t, df=None, f=None, dK=None, K=None, c=[], y=[], a=None, fnc=[]):
 
-        if self.ode_parallel: x_arr = allgather_vec(x, self.comm)
-        else: x_arr = x.array
+        x_arr = self.gather_vec(x)
 
         # ODE lhs (time derivative) residual part df
         if df is not None:
-
-            for i in range(self.numdof):
-                df[i] = self.df__[i](x_arr, c, t, fnc)
+            vs, ve = df.getOwnershipRange()
+            df.setValues(np.arange(vs, ve, dtype=PETSc.IntType), self.df__(x_arr, c, t, fnc)[vs:ve,0])
 
         # ODE rhs residual part f
         if f is not None:
-
-            for i in range(self.numdof):
-                f[i] = self.f__[i](x_arr, c, t, fnc)
+            vs, ve = f.getOwnershipRange()
+            f.setValues(np.arange(vs, ve, dtype=PETSc.IntType), self.f__(x_arr, c, t, fnc)[vs:ve,0])
 
         # ODE lhs (time derivative) stiffness part dK (ddf/dx)
         if dK is not None:
-
-            for i in range(self.numdof):
-                for j in range(self.numdof):
-                    dK[i,j] = self.dK__[i][j](x_arr, c, t, fnc)
+            self.dK_arr[self.dK_ids] = self.dK__(x_arr, c, t, fnc)
+            ms, me = dK.getOwnershipRange()
+            dK.setValues(np.arange(ms, me, dtype=PETSc.IntType), np.arange(self.numdof, dtype=PETSc.IntType), self.dK_arr[ms:me,:])
 
         # ODE rhs stiffness part K (df/dx)
         if K is not None:
-
-            for i in range(self.numdof):
-                for j in range(self.numdof):
-                    K[i,j] = self.K__[i][j](x_arr, c, t, fnc)
+            self.K_arr[self.K_ids] = self.K__(x_arr, c, t, fnc)
+            ms, me = K.getOwnershipRange()
+            K.setValues(np.arange(ms, me, dtype=PETSc.IntType), np.arange(self.numdof, dtype=PETSc.IntType), self.K_arr[ms:me,:])
 
         # auxiliary variable vector a (for post-processing or periodic state check)
         if a is not None:
-
-            for i in range(self.numdof):
-                a[i] = self.a__[i](x_arr, c, t, fnc)
+            a[:] = self.a__(x_arr, c, t, fnc)[:,0]
 
 
     # symbolic stiffness matrix contributions ddf_/dx, df_/dx
     def set_stiffness(self):
 
         for i in range(self.numdof):
+
+            # only differentiate w.r.t. the variables an expression actually depends on
+            fs_df, fs_f = sp.sympify(self.df_[i]).free_symbols, sp.sympify(self.f_[i]).free_symbols
+
             for j in range(self.numdof):
 
-                self.dK_[i][j] = sp.diff(self.df_[i],self.x_[j])
-                self.K_[i][j]  = sp.diff(self.f_[i],self.x_[j])
+                self.dK_[i,j] = sp.diff(self.df_[i],self.x_[j]) if self.x_[j] in fs_df else sp.S.Zero
+                self.K_[i,j]  = sp.diff(self.f_[i],self.x_[j]) if self.x_[j] in fs_f else sp.S.Zero
 
 
     # make Lambda functions out of symbolic Sympy expressions
@@ -81,10 +84,11 @@ class ode:
         ts = time.time()
         utilities.print_status("ODE model: Calling lambdify for residual expressions...", self.comm, e=" ")
 
-        for i in range(self.numdof):
-            self.df__[i] = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], self.df_[i], 'numpy')
-            self.f__[i] = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], self.f_[i], 'numpy')
-            self.a__[i] = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], self.a_[i], 'numpy')
+        # one vector-valued function each, so that evaluation is a single call instead of one per entry;
+        # common subexpressions (valve laws, elastances, ...) are evaluated only once per call
+        self.df__ = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], sp.Matrix(self.df_), 'numpy', cse=True)
+        self.f__ = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], sp.Matrix(self.f_), 'numpy', cse=True)
+        self.a__ = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], sp.Matrix(self.a_), 'numpy', cse=True)
 
         te = time.time() - ts
         utilities.print_status('t = %.4f s' % (te), self.comm)
@@ -92,51 +96,62 @@ class ode:
         ts = time.time()
         utilities.print_status("ODE model: Calling lambdify for stiffness expressions...", self.comm, e=" ")
 
-        for i in range(self.numdof):
-            for j in range(self.numdof):
-                if self.dK_[i][j] is not sp.S.Zero: self.dK__[i][j] = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], self.dK_[i][j], 'numpy')
-                else:                               self.dK__[i][j] = lambda a, b, c, d : 0
-                if self.K_[i][j] is not sp.S.Zero:  self.K__[i][j] = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], self.K_[i][j], 'numpy')
-                else:                               self.K__[i][j] = lambda a, b, c, d : 0
+        # constant entries (mostly structural zeros) are set once, only the remaining ones are lambdified
+        self.dK_arr, self.dK_ids, self.dK__ = self.lambdify_matrix(self.dK_)
+        self.K_arr, self.K_ids, self.K__ = self.lambdify_matrix(self.K_)
 
         te = time.time() - ts
         utilities.print_status('t = %.4f s' % (te), self.comm)
 
 
+    # lambdify a symbolic (numdof x numdof) object array: constant entries are stored in a dense array, and the non-constant
+    # ones are lambdified into one function returning their values (to be inserted at the returned indices)
+    def lambdify_matrix(self, M_):
+
+        M_arr = np.zeros((self.numdof,self.numdof))
+        rows, cols, M_var = [], [], []
+
+        for i in range(self.numdof):
+            for j in range(self.numdof):
+                if M_[i,j].is_number:
+                    M_arr[i,j] = float(M_[i,j])
+                else:
+                    rows.append(i), cols.append(j), M_var.append(M_[i,j])
+
+        M__ = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], M_var, 'numpy', cse=True)
+
+        return M_arr, (np.asarray(rows, dtype=int), np.asarray(cols, dtype=int)), M__
+
+
     # set prescribed variable values for residual
-    def set_prescribed_variables_residual(self, x, r, val, index_prescribed):
+    def set_prescribed_variables_residual(self, x, r, vals, indices_prescribed):
 
-        if self.ode_parallel: xs, xe = x.getOwnershipRange()
-        else: xs, xe = 0, len(x.array)
+        xs, xe = x.getOwnershipRange()
 
-        # modification of rhs entry
-        if index_prescribed in range(xs,xe):
-            r[index_prescribed] = x[index_prescribed] - val
+        # modification of rhs entries (locally owned ones)
+        owned = (indices_prescribed >= xs) & (indices_prescribed < xe)
+        r.setValues(indices_prescribed[owned], x.getValues(indices_prescribed[owned]) - vals[owned])
 
         r.assemble()
 
 
     # set stiffness entries for prescribed variable values
-    def set_prescribed_variables_stiffness(self, K, index_prescribed):
+    def set_prescribed_variables_stiffness(self, K, indices_prescribed):
 
-        # modification of stiffness matrix - all off-columns associated to index_prescribed = 0
-        # diagonal entry associated to index_prescribed = 1
-        K[index_prescribed,index_prescribed] = 1.
-        for j in range(self.numdof):
-            if j!=index_prescribed: K[index_prescribed,j] = 0.
+        ms, me = K.getOwnershipRange()
 
-        K.assemble()
+        # modification of stiffness matrix - all off-columns associated to prescribed indices = 0
+        # diagonal entries associated to prescribed indices = 1
+        if K.getType() != PETSc.Mat.Type.SEQDENSE: K.setOption(PETSc.Mat.Option.KEEP_NONZERO_PATTERN, True) # needed so that zeroRows does not change it!
+        K.zeroRows(indices_prescribed[(indices_prescribed >= ms) & (indices_prescribed < me)], diag=1.)
 
 
     # time step update
     def update(self, var, df, f, var_old, df_old, f_old, aux, aux_old):
 
-        if self.ode_parallel: vs, ve = var.getOwnershipRange()
-        else: vs, ve = 0, len(var.array)
-
-        var_old[vs:ve] = var[vs:ve]
-        df_old[vs:ve]  = df[vs:ve]
-        f_old[vs:ve]   = f[vs:ve]
+        var.copy(result=var_old)
+        df.copy(result=df_old)
+        f.copy(result=f_old)
 
         # aux vector is a numpy array
         aux_old[:] = aux[:]
@@ -145,35 +160,35 @@ class ode:
     # midpoint-averaging of state variables (for post-processing)
     def set_output_state(self, var, var_old, var_out, theta, midpoint=True):
 
-        if self.ode_parallel:
-            if isinstance(var, np.ndarray): vs, ve = 0, len(var)
-            else: vs, ve = var.getOwnershipRange()
-        else:
-            if isinstance(var, np.ndarray): vs, ve = 0, len(var)
-            else: vs, ve = 0, len(var.array)
-
-        if midpoint:
-            var_out[vs:ve] = theta*var[vs:ve] + (1.-theta)*var_old[vs:ve]
+        if isinstance(var, np.ndarray):
+            if midpoint:
+                np.multiply(theta, var, out=var_out)
+                var_out += (1.-theta)*var_old
+            else:
+                var_out[:] = var
         else:
-            var_out[vs:ve] = var[vs:ve]
+            if midpoint:
+                var_old.copy(result=var_out)
+                var_out.axpby(theta, 1.-theta, var)
+            else:
+                var.copy(result=var_out)
 
 
     # set up the dof, coupling quantity, rhs, and stiffness arrays
     def set_solve_arrays(self):
 
-        self.x_, self.a_, self.a__ = [0]*self.numdof, [0]*self.numdof, [0]*self.numdof
+        self.x_, self.a_, self.a__ = [0]*self.numdof, [0]*self.numdof, None
         self.c_, self.fnc_ = [], []
 
-        self.df_, self.f_, self.df__, self.f__ = [0]*self.numdof, [0]*self.numdof, [0]*self.numdof, [0]*self.numdof
-        self.dK_,  self.K_  = [[0]*self.numdof for _ in range(self.numdof)], [[0]*self.numdof for _ in range(self.numdof)]
-        self.dK__, self.K__ = [[0]*self.numdof for _ in range(self.numdof)], [[0]*self.numdof for _ in range(self.numdof)]
+        self.df_, self.f_, self.df__, self.f__ = [0]*self.numdof, [0]*self.numdof, None, None
+        self.dK_,  self.K_  = np.full((self.numdof,self.numdof), sp.S.Zero, dtype=object), np.full((self.numdof,self.numdof), sp.S.Zero, dtype=object)
+        self.dK__, self.K__ = None, None
 
 
     # output routine for ODE models
     def write_output(self, path, t, var, aux, nm=''):
 
-        if self.ode_parallel: var_arr = allgather_vec(var, self.comm)
-        else: var_arr = var.array
+        var_arr = self.gather_vec(var)
 
         # mode: 'wt' generates new file, 'a' appends to existing one
         if self.init: mode = 'wt'
@@ -183,45 +198,48 @@ class ode:
 
         if self.comm.rank == 0:
 
-            for i in range(len(self.varmap)):
+            for vname, vid in self.varmap.items():
 
-                filename = path+'/results_'+nm+'_'+list(self.varmap.keys())[i]+'.txt'
-                f = open(filename, mode)
+                f = self.get_output_file(path+'/results_'+nm+'_'+vname+'.txt', mode)
+                f.write('%.16E %.16E\n' % (t,var_arr[vid]))
 
-                f.write('%.16E %.16E\n' % (t,var_arr[list(self.varmap.values())[i]]))
+            for aname, aid in self.auxmap.items():
 
-                f.close()
+                f = self.get_output_file(path+'/results_'+nm+'_'+aname+'.txt', mode)
+                f.write('%.16E %.16E\n' % (t,aux[aid]))
 
-            for i in range(len(self.auxmap)):
+            for f in self.outfiles.values():
+                f.flush()
 
-                filename = path+'/results_'+nm+'_'+list(self.auxmap.keys())[i]+'.txt'
-                f = open(filename, mode)
 
-                f.write('%.16E %.16E\n' % (t,aux[list(self.auxmap.values())[i]]))
+    # get handle of a result file - files are only opened once and then kept open, since opening and closing
+    # them every time step is costly (especially on network file systems)
+    def get_output_file(self, filename, mode):
 
-                f.close()
+        if filename not in self.outfiles or self.outfiles[filename].closed:
+            self.outfiles[filename] = open(filename, mode)
 
+        return self.outfiles[filename]
 
-    # write restart routine for ODE models
-    def write_restart(self, path, nm, N, var):
 
-        if self.ode_parallel:
-            if isinstance(var, np.ndarray): var_arr = var
-            else: var_arr = allgather_vec(var, self.comm)
-        else:
-            if isinstance(var, np.ndarray): var_arr = var
-            else: var_arr = var.array
+    # close all result files
+    def close_output(self):
+
+        for f in self.outfiles.values():
+            f.close()
+
+        self.outfiles = {}
 
-        if self.comm.rank == 0:
 
-            filename = path+'/checkpoint_'+nm+'_'+str(N)+'.txt'
-            f = open(filename, 'wt')
+    # write restart routine for ODE models
+    def write_restart(self, path, nm, N, var):
 
-            for i in range(len(var_arr)):
+        if isinstance(var, np.ndarray): var_arr = var
+        else: var_arr = self.gather_vec(var)
 
-                f.write('%.16E\n' % (var_arr[i]))
+        if self.comm.rank == 0:
 
-            f.close()
+            np.savetxt(path+'/checkpoint_'+nm+'_'+str(N)+'.txt', var_arr, fmt='%.16E')
 
 
     # read restart routine for ODE models
@@ -238,8 +256,7 @@ class ode:
     # them in a new simulation starting from a homeostatic state)
     def write_initial(self, path, nm, varTc_old, varTc, auxTc_old, auxTc):
 
-        if self.ode_parallel: varTc_old_arr, varTc_arr = allgather_vec(varTc_old, self.comm), allgather_vec(varTc, self.comm)
-        else: varTc_old_arr, varTc_arr = varTc_old.array, varTc.array
+        varTc_old_arr, varTc_arr = self.gather_vec(varTc_old), self.gather_vec(varTc)
 
         if self.comm.rank == 0:
 
@@ -248,15 +265,15 @@ class ode:
             filename2 = path+'/results_'+nm+'_initial_data_Tend.txt' # conditions at end of cycle
             f2 = open(filename2, 'wt')
 
-            for i in range(len(self.varmap)):
+            for vname, vid in self.varmap.items():
 
-                f1.write('%s %.16E\n' % (list(self.varmap.keys())[i]+'_0',varTc_old_arr[list(self.varmap.values())[i]]))
-                f2.write('%s %.16E\n' % (list(self.varmap.keys())[i]+'_0',varTc_arr[list(self.varmap.values())[i]]))
+                f1.write('%s %.16E\n' % (vname+'_0',varTc_old_arr[vid]))
+                f2.write('%s %.16E\n' % (vname+'_0',varTc_arr[vid]))
 
-            for i in range(len(self.auxmap)):
+            for aname, aid in self.auxmap.items():
 
-                f1.write('%s %.16E\n' % (list(self.auxmap.keys())[i]+'_0',auxTc_old[list(self.auxmap.values())[i]]))
-                f2.write('%s %.16E\n' % (list(self.auxmap.keys())[i]+'_0',auxTc[list(self.auxmap.values())[i]]))
+                f1.write('%s %.16E\n' % (aname+'_0',auxTc_old[aid]))
+                f2.write('%s %.16E\n' % (aname+'_0',auxTc[aid]))
 
             f1.close()
             f2.close()
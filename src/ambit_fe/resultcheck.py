@@ -8,7 +8,6 @@
 
 import sys
 import numpy as np
-from petsc4py import PETSc
 
 from . import mpiroutines, utilities
 from .mpiroutines import allgather_vec
@@ -22,53 +21,53 @@ def results_check_node(u, check_node, u_corr, V, comm, tol=1.0e-6, nm='vec', rea
     # block size of vector to check
     bs = u.x.petsc_vec.getBlockSize()
 
-    # computed errors (difference between simulation and expected results)
-    errs = np.zeros(bs*len(check_node))
-
     # dof coordinates
     co = V.tabulate_dof_coordinates()
 
-    # index map
-    #im = V.dofmap.index_map.global_indices() # function seems to have gone!
-    im = np.asarray(V.dofmap.index_map.local_to_global(np.arange(V.dofmap.index_map.size_local + V.dofmap.index_map.num_ghosts, dtype=np.int32)), dtype=PETSc.IntType)
+    # number of owned (non-ghost) dofs
+    size_local = V.dofmap.index_map.size_local
+
+    # owned values of vector to check
+    u_loc = u.x.petsc_vec.getArray(readonly=True)
 
     readtolerance = int(-np.log10(readtol))
 
     # in parallel, dof indices can be ordered differently, so we need to check the position of the node in the
-    # re-ordered local co array and then grep out the corresponding dof index from the index map
-    dof_indices, dof_indices_gathered = {}, []
+    # owned part of the local co array, and then grep out the corresponding values locally - since every dof
+    # is owned by exactly one process, only these values (not the whole vector) have to be gathered
+    # (dof coordinates only need to be rounded once for all nodes)
+    co_rounded = np.round(co[:size_local],readtolerance)
+    node_vals = {}
     for i in range(len(check_node)):
 
-        ind = np.where((np.round(check_node[i],readtolerance) == np.round(co,readtolerance)).all(axis=1))[0]
+        ind = np.flatnonzero((np.round(check_node[i],readtolerance) == co_rounded).all(axis=1))
 
-        if len(ind): dof_indices[i] = im[ind[0]]
+        if len(ind): node_vals[i] = u_loc[bs*ind[0]:bs*(ind[0]+1)].copy()
 
-    # gather indices
-    dof_indices_gathered = comm.allgather(dof_indices)
-
-    # make a flat and ordered list of indices (may still have duplicates)
-    dof_indices_flat = []
-    for i in range(len(check_node)):
+    # gather node values
+    node_vals_gathered = comm.allgather(node_vals)
 
-        for l in range(len(dof_indices_gathered)):
-            if i in dof_indices_gathered[l].keys():
-                dof_indices_flat.append(dof_indices_gathered[l][i])
+    # values at the nodes (all block components) and computed errors (difference between simulation and expected results)
+    u_vals = np.zeros(bs*len(check_node))
+    found = set()
+    for nv in node_vals_gathered:
+        for i in nv.keys():
+            u_vals[bs*i:bs*(i+1)] = nv[i]
+            found.add(i)
 
-    # create unique list (remove duplicates, but keep order)
-    dof_indices_unique = list(dict.fromkeys(dof_indices_flat))
+    # a node that no process has found (e.g. wrong coordinates or read tolerance) lets the check fail
+    for i in range(len(check_node)):
+        if i not in found:
+            utilities.print_status("Check node %i (%s) not found for "%(i,str(check_node[i]))+nm+"!", comm)
+            success = False
 
-    # gather vector to check
-    u_sq = allgather_vec(u.x.petsc_vec, comm)
+    errs = np.abs(u_vals - np.asarray(u_corr))
 
-    for i in range(len(check_node)):
-        for j in range(bs):
-            errs[bs*i+j] = abs(u_sq[bs*dof_indices_unique[i]+j]-u_corr[bs*i+j])
-            if errs[bs*i+j] > tol:
-                success = False
+    if np.any(errs > tol):
+        success = False
 
-    for i in range(len(check_node)):
-        for j in range(bs):
-            utilities.print_status(nm+"[%i]    = %.16E,    CORR = %.16E,    err = %.16E" % (bs*i+j, u_sq[bs*dof_indices_unique[i]+j], u_corr[bs*i+j], errs[bs*i+j]), comm)
+    for k in range(len(errs)):
+        utilities.print_status(nm+"[%i]    = %.16E,    CORR = %.16E,    err = %.16E" % (k, u_vals[k], u_corr[k], errs[k]), comm)
 
     utilities.print_status("Max error: %E" % (max(errs)), comm)
 
@@ -196,8 +196,8 @@ class SignallingNetworkProblem(problem_base):
         if ms: self.signet.read_restart(self.output_path_signet, sname+'_s_set', rst, self.s_set)
 
         if self.signet.T_cycl > 0: # read heart cycle info
-            self.ti.cycle[0] = np.loadtxt(self.output_path_signet+'/checkpoint_'+sname+'_cycledata_'+str(rst)+'.txt', usecols=(0), dtype=int)
-            self.ti.cycleerror[0] = np.loadtxt(self.output_path_signet+'/checkpoint_'+sname+'_cycledata_'+str(rst)+'.txt', usecols=(1), dtype=float)
+            cycledata = np.loadtxt(self.output_path_signet+'/checkpoint_'+sname+'_cycledata_'+str(rst)+'.txt')
+            self.ti.cycle[0], self.ti.cycleerror[0] = int(cycledata[0]), float(cycledata[1])
             self.pbase.t_init -= (self.ti.cycle[0]-1) * self.signet.T_cycl
 
 
@@ -272,7 +272,8 @@ class SignallingNetworkProblem(problem_base):
 
 
     def destroy(self):
-        pass
+
+        self.signet.close_output()
 
 
 
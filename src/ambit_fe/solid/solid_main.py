@@ -54,6 +54,8 @@ class SolidmechanicsProblem(problem_base):
         self.timint = time_params.get('timint', 'static')
 
         self.results_to_write = io_params['results_to_write']
+        # post-processing (scalar) forms - compiled once on first use
+        self.postproc_forms = {}
 
         self.io = io
 
@@ -343,7 +345,7 @@ class SolidmechanicsProblem(problem_base):
 
         # growth threshold (as function, since in multiscale approach, it can vary element-wise)
         if self.have_growth and self.localsolve:
-            growth_thres_proj = project(self.mat_growth_thres, self.Vd_scalar, self.dx, domids=self.domain_ids, comm=self.pbase.comm, entity_maps=self.io.entity_maps)
+            growth_thres_proj = project(self.mat_growth_thres, self.Vd_scalar, self.dx, domids=self.domain_ids, comm=self.pbase.comm, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
             self.growth_thres.x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
             self.growth_thres.interpolate(growth_thres_proj)
 
@@ -733,12 +735,12 @@ class SolidmechanicsProblem(problem_base):
     def evaluate_active_stress(self):
 
         if self.have_frank_starling:
-            amp_old_proj = project(self.amp_old_, self.Vd_scalar, self.dx, domids=self.domain_ids, comm=self.pbase.comm, entity_maps=self.io.entity_maps)
+            amp_old_proj = project(self.amp_old_, self.Vd_scalar, self.dx, domids=self.domain_ids, comm=self.pbase.comm, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
             self.amp_old.x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
             self.amp_old.interpolate(amp_old_proj)
 
         # project and interpolate to quadrature function space
-        tau_a_proj = project(self.tau_a_, self.Vd_scalar, self.dx, domids=self.domain_ids, comm=self.pbase.comm, entity_maps=self.io.entity_maps)
+        tau_a_proj = project(self.tau_a_, self.Vd_scalar, self.dx, domids=self.domain_ids, comm=self.pbase.comm, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
         self.tau_a.x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
         self.tau_a.interpolate(tau_a_proj)
 
@@ -749,11 +751,13 @@ class SolidmechanicsProblem(problem_base):
     # computes and prints the growth rate of the whole solid
     def compute_solid_growth_rate(self, N, t):
 
-        dtheta_all = ufl.as_ufl(0)
-        for n, M in enumerate(self.domain_ids):
-            dtheta_all += (self.theta - self.theta_old) / (self.pbase.dt) * self.dx(M)
+        if 'growthrate' not in self.postproc_forms:
+            dtheta_all = ufl.as_ufl(0)
+            for n, M in enumerate(self.domain_ids):
+                dtheta_all += (self.theta - self.theta_old) / (self.pbase.dt) * self.dx(M)
+            self.postproc_forms['growthrate'] = fem.form(dtheta_all, jit_options=self.io.jit_options)
 
-        gr = fem.assemble_scalar(fem.form(dtheta_all))
+        gr = fem.assemble_scalar(self.postproc_forms['growthrate'])
         gr = self.comm.allgather(gr)
         self.growth_rate = sum(gr)
 
@@ -772,16 +776,18 @@ class SolidmechanicsProblem(problem_base):
     # computes the solid's total strain energy and internal power
     def compute_strain_energy_power(self, N, t):
 
-        se_all, ip_all = ufl.as_ufl(0), ufl.as_ufl(0)
-        for n, M in enumerate(self.domain_ids):
-            se_all += self.ma[n].S(self.u, self.p, self.vel, ivar=self.internalvars, returnquantity='strainenergy') * self.dx(M)
-            ip_all += ufl.inner(self.ma[n].S(self.u, self.p, self.vel, ivar=self.internalvars),self.ki.Edot(self.u, self.vel)) * self.dx(M)
+        if 'strainenergy' not in self.postproc_forms:
+            se_all, ip_all = ufl.as_ufl(0), ufl.as_ufl(0)
+            for n, M in enumerate(self.domain_ids):
+                se_all += self.ma[n].S(self.u, self.p, self.vel, ivar=self.internalvars, returnquantity='strainenergy') * self.dx(M)
+                ip_all += ufl.inner(self.ma[n].S(self.u, self.p, self.vel, ivar=self.internalvars),self.ki.Edot(self.u, self.vel)) * self.dx(M)
+            self.postproc_forms['strainenergy'], self.postproc_forms['internalpower'] = fem.form(se_all, jit_options=self.io.jit_options), fem.form(ip_all, jit_options=self.io.jit_options)
 
-        se = fem.assemble_scalar(fem.form(se_all))
+        se = fem.assemble_scalar(self.postproc_forms['strainenergy'])
         se = self.pbase.comm.allgather(se)
         strain_energy = sum(se)
 
-        ip = fem.assemble_scalar(fem.form(ip_all))
+        ip = fem.assemble_scalar(self.postproc_forms['internalpower'])
         ip = self.pbase.comm.allgather(ip)
         internal_power = sum(ip)
 
@@ -802,24 +808,27 @@ class SolidmechanicsProblem(problem_base):
     # computes the total strain energy and internal power of a membrane (reduced) solid model
     def compute_strain_energy_power_membrane(self, N, t):
 
-        se_mem_all, ip_mem_all = ufl.as_ufl(0), ufl.as_ufl(0)
-        for nm in range(len(self.bc_dict['membrane'])):
+        if 'strainenergy_membrane' not in self.postproc_forms:
+            se_mem_all, ip_mem_all = ufl.as_ufl(0), ufl.as_ufl(0)
+            for nm in range(len(self.bc_dict['membrane'])):
 
-            internal = self.bc_dict['membrane'][nm].get('internal', False)
+                internal = self.bc_dict['membrane'][nm].get('internal', False)
 
-            if internal:
-                fcts = self.bc_dict['membrane'][nm].get('facet_side', '+')
-                se_mem_all += (self.bstrainenergy[nm])(fcts) * self.bmeasures[2](self.idmem[nm])
-                ip_mem_all += (self.bintpower[nm])(fcts) * self.bmeasures[2](self.idmem[nm])
-            else:
-                se_mem_all += self.bstrainenergy[nm] * self.bmeasures[0](self.idmem[nm])
-                ip_mem_all += self.bintpower[nm] * self.bmeasures[0](self.idmem[nm])
+                if internal:
+                    fcts = self.bc_dict['membrane'][nm].get('facet_side', '+')
+                    se_mem_all += (self.bstrainenergy[nm])(fcts) * self.bmeasures[2](self.idmem[nm])
+                    ip_mem_all += (self.bintpower[nm])(fcts) * self.bmeasures[2](self.idmem[nm])
+                else:
+                    se_mem_all += self.bstrainenergy[nm] * self.bmeasures[0](self.idmem[nm])
+                    ip_mem_all += self.bintpower[nm] * self.bmeasures[0](self.idmem[nm])
+
+            self.postproc_forms['strainenergy_membrane'], self.postproc_forms['internalpower_membrane'] = fem.form(se_mem_all, jit_options=self.io.jit_options), fem.form(ip_mem_all, jit_options=self.io.jit_options)
 
-        se_mem = fem.assemble_scalar(fem.form(se_mem_all))
+        se_mem = fem.assemble_scalar(self.postproc_forms['strainenergy_membrane'])
         se_mem = self.pbase.comm.allgather(se_mem)
         strain_energy_mem = sum(se_mem)
 
-        ip_mem = fem.assemble_scalar(fem.form(ip_mem_all))
+        ip_mem = fem.assemble_scalar(self.postproc_forms['internalpower_membrane'])
         ip_mem = self.pbase.comm.allgather(ip_mem)
         internal_power_mem = sum(ip_mem)
 
@@ -872,7 +881,7 @@ class SolidmechanicsProblem(problem_base):
         for n, M in enumerate(self.domain_ids):
             vol_all += ufl.det(ufl.Identity(len(uf)) + ufl.grad(uf)) * self.dx(M)
 
-        vol = fem.assemble_scalar(fem.form(vol_all))
+        vol = fem.assemble_scalar(fem.form(vol_all, jit_options=self.io.jit_options))
         vol = self.pbase.comm.allgather(vol)
         volume = sum(vol)
 
@@ -892,24 +901,24 @@ class SolidmechanicsProblem(problem_base):
         utilities.print_status("FEM form compilation for solid...", self.pbase.comm, e=" ")
 
         if not pre:
-            self.res_u  = fem.form(self.weakform_u, entity_maps=self.io.entity_maps)
-            self.jac_uu = fem.form(self.weakform_lin_uu, entity_maps=self.io.entity_maps)
+            self.res_u  = fem.form(self.weakform_u, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+            self.jac_uu = fem.form(self.weakform_lin_uu, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
             if self.incompressible_2field:
-                self.res_p  = fem.form(self.weakform_p, entity_maps=self.io.entity_maps)
-                self.jac_up = fem.form(self.weakform_lin_up, entity_maps=self.io.entity_maps)
-                self.jac_pu = fem.form(self.weakform_lin_pu, entity_maps=self.io.entity_maps)
+                self.res_p  = fem.form(self.weakform_p, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+                self.jac_up = fem.form(self.weakform_lin_up, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+                self.jac_pu = fem.form(self.weakform_lin_pu, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
                 if not isinstance(self.weakform_lin_pp, ufl.constantvalue.Zero):
-                    self.jac_pp = fem.form(self.weakform_lin_pp, entity_maps=self.io.entity_maps)
+                    self.jac_pp = fem.form(self.weakform_lin_pp, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
                 else:
                     self.jac_pp = None
         else:
-            self.res_u  = fem.form(self.weakform_prestress_u, entity_maps=self.io.entity_maps)
-            self.jac_uu = fem.form(self.weakform_lin_prestress_uu, entity_maps=self.io.entity_maps)
+            self.res_u  = fem.form(self.weakform_prestress_u, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+            self.jac_uu = fem.form(self.weakform_lin_prestress_uu, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
             if self.incompressible_2field:
-                self.res_p  = fem.form(self.weakform_prestress_p, entity_maps=self.io.entity_maps)
-                self.jac_up = fem.form(self.weakform_lin_prestress_up, entity_maps=self.io.entity_maps)
-                self.jac_pu = fem.form(self.weakform_lin_prestress_pu, entity_maps=self.io.entity_maps)
-                self.jac_pp = fem.form(self.weakform_lin_prestress_pp, entity_maps=self.io.entity_maps)
+                self.res_p  = fem.form(self.weakform_prestress_p, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+                self.jac_up = fem.form(self.weakform_lin_prestress_up, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+                self.jac_pu = fem.form(self.weakform_lin_prestress_pu, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
+                self.jac_pp = fem.form(self.weakform_lin_prestress_pp, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
 
         te = time.time() - ts
         utilities.print_status("t = %.4f s" % (te), self.pbase.comm)
@@ -1034,7 +1043,7 @@ class SolidmechanicsProblem(problem_base):
 
         if 'fibers' in self.results_to_write and self.io.write_results_every > 0:
             for i in range(len(self.fibarray)):
-                fib_proj = project(self.fib_func[i], self.V_u, self.dx, domids=self.domain_ids, nm='Fiber'+str(i+1), comm=self.pbase.comm, entity_maps=self.io.entity_maps)
+                fib_proj = project(self.fib_func[i], self.V_u, self.dx, domids=self.domain_ids, nm='Fiber'+str(i+1), comm=self.pbase.comm, entity_maps=self.io.entity_maps, jit_options=self.io.jit_options)
                 self.io.write_output_pre(self, fib_proj, 0.0, 'fib_'+self.fibarray[i])
 
 
@@ -1144,7 +1153,7 @@ class SolidmechanicsSolver(solver_base):
             weakform_lin_aa = ufl.derivative(weakform_a, self.pb.a_old, self.pb.du) # actually linear in a_old
 
             # solve for consistent initial acceleration a_old
-            res_a, jac_aa  = fem.form(weakform_a), fem.form(weakform_lin_aa)
+            res_a, jac_aa  = fem.form(weakform_a, jit_options=self.pb.io.jit_options), fem.form(weakform_lin_aa, jit_options=self.pb.io.jit_options)
             self.solnln.solve_consistent_ini_acc(res_a, jac_aa, self.pb.a_old)
 
             te = time.time() - ts
@@ -12,7 +12,7 @@ import ufl
 from petsc4py import PETSc
 
 
-def project(v, V, dx_, domids=np.arange(1,2), bcs=[], nm=None, comm=None, entity_maps={}):
+def project(v, V, dx_, domids=np.arange(1,2), bcs=[], nm=None, comm=None, entity_maps={}, jit_options={}):
 
     w = ufl.TestFunction(V)
     Pv = ufl.TrialFunction(V)
@@ -39,9 +39,9 @@ def project(v, V, dx_, domids=np.arange(1,2), bcs=[], nm=None, comm=None, entity
     function = fem.Function(V, name=nm)
 
     if bool(entity_maps):
-        a_form, L_form = fem.form(a, entity_maps=entity_maps), fem.form(L, entity_maps=entity_maps)
+        a_form, L_form = fem.form(a, entity_maps=entity_maps, jit_options=jit_options), fem.form(L, entity_maps=entity_maps, jit_options=jit_options)
     else:
-        a_form, L_form = fem.form(a), fem.form(L)
+        a_form, L_form = fem.form(a, jit_options=jit_options), fem.form(L, jit_options=jit_options)
 
     # assemble linear system
     A = fem.petsc.assemble_matrix(a_form, bcs)
@@ -179,6 +179,8 @@ class solver_nonlinear:
         self.PTC_randadapt_range = solver_params.get('ptc_randadapt_range', [0.85, 1.35])
         self.maxresval = solver_params.get('catch_max_res_value', 1e16)
         self.direct_solver = solver_params.get('direct_solver', 'mumps')
+        self.mumps_icntl = solver_params.get('mumps_icntl', {})
+        self.mumps_cntl = solver_params.get('mumps_cntl', {})
         self.iterative_solver = solver_params.get('iterative_solver', 'gmres')
 
         precond_fields = solver_params.get('precond_fields', [[]])
@@ -240,6 +242,7 @@ class solver_nonlinear:
 
         self.print_local_iter = solver_params.get('print_local_iter', False)
         self.rebuild_prec_every_it = solver_params.get('rebuild_prec_every_it', 1)
+        self.lu_refactor_every_it = solver_params.get('lu_refactor_every_it', 1)
         self.tol_res_local = solver_params.get('tol_res_local', 1e-10)
         self.tol_inc_local = solver_params.get('tol_inc_local', 1e-10)
 
@@ -303,6 +306,8 @@ class solver_nonlinear:
 
                     self.ksp[npr].setOperators(self.K_list_sol[npr][0][0])
 
+                self.set_mumps_controls(self.ksp[npr])
+
             elif self.solvetype[npr]=='iterative':
 
                 if self.nfields[npr] > 1:
@@ -539,6 +544,18 @@ class solver_nonlinear:
                 raise NameError("Unknown solvetype!")
 
 
+    # set user-defined MUMPS (integer and real) controls on the factor matrix of a direct solver (operators need to be set)
+    def set_mumps_controls(self, ksp):
+
+        if self.direct_solver=='mumps' and (bool(self.mumps_icntl) or bool(self.mumps_cntl)):
+            ksp.getPC().setFactorSetUpSolverType()
+            F = ksp.getPC().getFactorMatrix()
+            for i, v in self.mumps_icntl.items():
+                F.setMumpsIcntl(i, v)
+            for i, v in self.mumps_cntl.items():
+                F.setMumpsCntl(i, v)
+
+
     # solve for consistent initial acceleration a_old
     def solve_consistent_ini_acc(self, res_a, jac_aa, a_old):
 
@@ -645,10 +662,19 @@ class solver_nonlinear:
 
                         tes = time.time()
 
-                        self.K_full_nest[npr].convert("aij", out=self.K_full_merged[npr])
-                        tme = time.time() - tes
-                        if self.pb[npr].io.print_enhanced_info:
-                            utilities.print_status(" "*self.indlen_[npr] + "      === MAT merge, te = %.4f s" % (tme), self.comm)
+                        # re-factorize if requested (default is every iteration, always in the first iteration of a solve) - otherwise, the old factorization is used (modified Newton), and no merge is needed
+                        if (it-1) % self.lu_refactor_every_it == 0:
+
+                            self.ksp[npr].getPC().setReusePreconditioner(False)
+
+                            self.K_full_nest[npr].convert("aij", out=self.K_full_merged[npr])
+                            tme = time.time() - tes
+                            if self.pb[npr].io.print_enhanced_info:
+                                utilities.print_status(" "*self.indlen_[npr] + "      === MAT merge, te = %.4f s" % (tme), self.comm)
+
+                        else:
+
+                            self.ksp[npr].getPC().setReusePreconditioner(True)
 
                         self.r_arr[:] = self.r_full_nest[npr].getArray(readonly=True)
                         self.r_full_merged[npr].placeArray(self.r_arr)
@@ -659,8 +685,10 @@ class solver_nonlinear:
                         te += time.time() - tes
 
                         tss = time.time()
-                        # solve the linear system
-                        self.ksp[npr].solve(-self.r_full_merged[npr], self.del_full)
+                        # solve the linear system - solve K del = r and flip the sign, so that no negated residual copy is created in each iteration
+                        # (only valid since all our KSPs start from a zero initial guess)
+                        self.ksp[npr].solve(self.r_full_merged[npr], self.del_full)
+                        self.del_full.scale(-1.)
                         ts = time.time() - tss
 
                         self.r_full_merged[npr].resetArray()
@@ -708,8 +736,9 @@ class solver_nonlinear:
                         te += time.time() - tes
 
                         tss = time.time()
-                        # solve the linear system
-                        self.ksp[npr].solve(-r, self.del_full)
+                        # solve the linear system - K del = r with sign flip afterwards (only valid since the KSP starts from a zero initial guess)
+                        self.ksp[npr].solve(r, self.del_full)
+                        self.del_full.scale(-1.)
                         ts = time.time() - tss
 
                         linconv = self.ksp[npr].getConvergedReason()
@@ -727,12 +756,17 @@ class solver_nonlinear:
 
                 else:
 
+                    # re-use old factorization if requested (modified Newton)
+                    if self.solvetype[npr]=='direct':
+                        self.ksp[npr].getPC().setReusePreconditioner((it-1) % self.lu_refactor_every_it != 0)
+
                     # operator values have changed - do we need to re-set it?
                     self.ksp[npr].setOperators(self.K_list_sol[npr][0][0])
 
                     tss = time.time()
-                    # solve the linear system
-                    self.ksp[npr].solve(-self.r_list_sol[npr][0], self.del_x_sol[npr][0])
+                    # solve the linear system - K del = r with sign flip afterwards (only valid since the KSP starts from a zero initial guess)
+                    self.ksp[npr].solve(self.r_list_sol[npr][0], self.del_x_sol[npr][0])
+                    self.del_x_sol[npr][0].scale(-1.)
                     ts = time.time() - tss
 
                     if self.solvetype[npr]=='iterative':
@@ -927,7 +961,7 @@ class solver_nonlinear:
             for i in range(num_loc_res):
 
                 # interpolate symbolic increment form into increment vector
-                increment_proj = project(increment_forms[i], functionspaces[i], self.pb[0].dx, domids=self.pb[0].domain_ids, comm=self.comm)
+                increment_proj = project(increment_forms[i], functionspaces[i], self.pb[0].dx, domids=self.pb[0].domain_ids, comm=self.comm, jit_options=self.pb[0].io.jit_options)
                 increments[i].x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
                 increments[i].interpolate(increment_proj)
 
@@ -938,7 +972,7 @@ class solver_nonlinear:
 
             for i in range(num_loc_res):
                 # interpolate symbolic residual form into residual vector
-                residual_proj = project(residual_forms[i], functionspaces[i], self.pb[0].dx, domids=self.pb[0].domain_ids, comm=self.comm)
+                residual_proj = project(residual_forms[i], functionspaces[i], self.pb[0].dx, domids=self.pb[0].domain_ids, comm=self.comm, jit_options=self.pb[0].io.jit_options)
                 residuals[i].x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
                 residuals[i].interpolate(residual_proj)
                 # get residual and increment inf norms
@@ -1038,7 +1072,11 @@ class solver_nonlinear_ode(solver_nonlinear):
             self.ksp[0] = PETSc.KSP().create(self.comm_sq)
         self.ksp[0].setType("preonly")
         self.ksp[0].getPC().setType("lu")
-        self.ksp[0].getPC().setFactorSolverType(self.direct_solver)
+        # dense ODE matrices can only be factorized by PETSc's own (LAPACK) LU
+        if self.pb.K_list[0][0].getType() == PETSc.Mat.Type.SEQDENSE:
+            self.ksp[0].getPC().setFactorSolverType("petsc")
+        else:
+            self.ksp[0].getPC().setFactorSolverType(self.direct_solver)
         self.ksp[0].setOperators(self.pb.K_list[0][0])
 
         # solution increment
@@ -1078,8 +1116,9 @@ class solver_nonlinear_ode(solver_nonlinear):
             te = time.time() - tes
 
             tss = time.time()
-            # solve linear system
-            self.ksp[0].solve(-self.pb.r_list[0], self.del_s)
+            # solve linear system - K del = r with sign flip afterwards (only valid since the KSP starts from a zero initial guess)
+            self.ksp[0].solve(self.pb.r_list[0], self.del_s)
+            self.del_s.scale(-1.)
             ts = time.time() - tss
 
             tes = time.time()
@@ -10,7 +10,7 @@ import sys
 from petsc4py import PETSc
 import ufl
 
-from . import expression, utilities
+from . import utilities
 
 """
 Time-integration classes for all problems
@@ -73,10 +73,9 @@ class timeintegration():
     def set_time_funcs(self, t, dt, midp=False):
 
         for m in self.funcs_to_update_vec:
-            load = expression.template_vector(dim=self.dim)
-            load.val_x, load.val_y, load.val_z = list(m.values())[0][0](t), list(m.values())[0][1](t), list(m.values())[0][2](t)
-            list(m.keys())[0].interpolate(load.evaluate)
-            list(m.keys())[0].x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+            func, curves = next(iter(m.items()))
+            # spatially constant load: set (owned and ghosted) dof values directly instead of interpolating
+            func.x.array.reshape(-1, self.dim)[:] = [curves[i](t) for i in range(self.dim)]
             # in case we wanna set a function that is a product of values in a file and a time curve
             if 'funcs_mult' in m.keys():
                 # m['funcs_mult'][1] is the function that is set (as DBC)
@@ -84,10 +83,8 @@ class timeintegration():
                 m['funcs_mult'][1].x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
 
         for m in self.funcs_to_update:
-            load = expression.template()
-            load.val = list(m.values())[0](t)
-            list(m.keys())[0].interpolate(load.evaluate)
-            list(m.keys())[0].x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+            func, curve = next(iter(m.items()))
+            func.x.array[:] = curve(t)
 
         # set the time in user expressions - note that they hence must have a class variable self.t
         for m in self.funcsexpr_to_update_vec:
@@ -105,16 +102,13 @@ class timeintegration():
             tmid = timefac*t + (1.-timefac)*(t-dt)
 
             for m in self.funcs_to_update_vec_mid:
-                load = expression.template_vector(dim=self.dim)
-                load.val_x, load.val_y, load.val_z = list(m.values())[0][0](tmid), list(m.values())[0][1](tmid), list(m.values())[0][2](tmid)
-                list(m.keys())[0].interpolate(load.evaluate)
-                list(m.keys())[0].x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+                func, curves = next(iter(m.items()))
+                # spatially constant load: set (owned and ghosted) dof values directly instead of interpolating
+                func.x.array.reshape(-1, self.dim)[:] = [curves[i](tmid) for i in range(self.dim)]
 
             for m in self.funcs_to_update_mid:
-                load = expression.template()
-                load.val = list(m.values())[0](tmid)
-                list(m.keys())[0].interpolate(load.evaluate)
-                list(m.keys())[0].x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+                func, curve = next(iter(m.items()))
+                func.x.array[:] = curve(tmid)
 
             # set the time in user expressions - note that they hence must have a class variable self.t
             for m in self.funcsexpr_to_update_vec_mid:
@@ -131,16 +125,13 @@ class timeintegration():
     def set_time_funcs_pre(self, t):
 
         for m in self.funcs_to_update_vec_pre:
-            load = expression.template_vector(dim=self.dim)
-            load.val_x, load.val_y, load.val_z = list(m.values())[0][0](t), list(m.values())[0][1](t), list(m.values())[0][2](t)
-            list(m.keys())[0].interpolate(load.evaluate)
-            list(m.keys())[0].x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+            func, curves = next(iter(m.items()))
+            # spatially constant load: set (owned and ghosted) dof values directly instead of interpolating
+            func.x.array.reshape(-1, self.dim)[:] = [curves[i](t) for i in range(self.dim)]
 
         for m in self.funcs_to_update_pre:
-            load = expression.template()
-            load.val = list(m.values())[0](t)
-            list(m.keys())[0].interpolate(load.evaluate)
-            list(m.keys())[0].x.petsc_vec.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+            func, curve = next(iter(m.items()))
+            func.x.array[:] = curve(t)
 
         # set the time in user expressions - note that they hence must have a class variable self.t
         for m in self.funcsexpr_to_update_vec_pre:
@@ -113,6 +113,10 @@ if category=='flow0d' or category=='all':
 
     errs['test_flow0d_0dheart_syspul 1'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'test_flow0d_0dheart_syspul.py'])
     errs['test_flow0d_0dheart_syspul 1 restart'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'test_flow0d_0dheart_syspul.py', str(450)]) # tests restart from step 450
+    errs['test_flow0d_0dheart_syspul_evaluate 1'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'test_flow0d_0dheart_syspul_evaluate.py'])
+    errs['test_flow0d_0dheart_syspul_evaluate 2'] = subprocess.call(['mpiexec', '-n', '2', 'python3', 'test_flow0d_0dheart_syspul_evaluate.py'])
+    errs['test_flow0d_0dheart_syspul_prescribed 1'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'test_flow0d_0dheart_syspul_prescribed.py'])
+    errs['test_flow0d_0dheart_syspul_prescribed 2'] = subprocess.call(['mpiexec', '-n', '2', 'python3', 'test_flow0d_0dheart_syspul_prescribed.py'])
 
     errs['test_flow0d_0dheart_syspulcor 1'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'test_flow0d_0dheart_syspulcor.py'])
     errs['test_flow0d_0dheart_syspulcap 1'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'test_flow0d_0dheart_syspulcap.py'])
@@ -124,6 +128,8 @@ if category=='solid_flow0d' or category=='all':
     errs['test_solid_flow0d_monodir_4elwindkesselLsZ_chamber 1'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'test_solid_flow0d_monodir_4elwindkesselLsZ_chamber.py'])
     errs['test_solid_flow0d_monodir_4elwindkesselLsZ_chamber 2'] = subprocess.call(['mpiexec', '-n', '2', 'python3', 'test_solid_flow0d_monodir_4elwindkesselLsZ_chamber.py'])
 
+    errs['test_solid_flow0d_monodir_4elwindkesselLsZ_chamber_defaultcoupling 1'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'test_solid_flow0d_monodir_4elwindkesselLsZ_chamber_defaultcoupling.py'])
+
     errs['test_solid_flow0d_monodir_4elwindkesselLsZ_chamber_bgs2x2 2'] = subprocess.call(['mpiexec', '-n', '2', 'python3', 'test_solid_flow0d_monodir_4elwindkesselLsZ_chamber_bgs2x2.py'])
     errs['test_solid_flow0d_monodir_4elwindkesselLsZ_chamber_bgs2x2fieldsplit 2'] = subprocess.call(['mpiexec', '-n', '2', 'python3', 'test_solid_flow0d_monodir_4elwindkesselLsZ_chamber_bgs2x2fieldsplit.py'])
 
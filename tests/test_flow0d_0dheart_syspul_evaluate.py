@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+"""
+0D model evaluation check: residual and stiffness parts (df, f, dK, K) of the closed-loop syspul model as evaluated by the ODE base class,
+compared to an entry-by-entry evaluation of the underlying symbolic expressions
+- serial and parallel 0D layout
+- incl. piecewise valve laws (both valve states are hit by the chosen state)
+"""
+
+import ambit_fe
+from ambit_fe.flow0d.cardiovascular0D_syspul import cardiovascular0Dsyspul
+from ambit_fe.mpiroutines import allgather_vec
+
+import numpy as np
+import sympy as sp
+from mpi4py import MPI
+from petsc4py import PETSc
+import pytest
+
+
+@pytest.mark.flow0d
+def test_main():
+
+    comm = MPI.COMM_WORLD
+
+    chamber_models = {'lv' : {'type' : '0D_elast', 'activation_curve' : 2},
+                      'rv' : {'type' : '0D_elast', 'activation_curve' : 2},
+                      'la' : {'type' : '0D_elast', 'activation_curve' : 1},
+                      'ra' : {'type' : '0D_elast', 'activation_curve' : 1}}
+
+    valvelaws = {'av' : ['smooth_pres_momentum',0],
+                 'mv' : ['pwlin_pres'],
+                 'pv' : ['pwlin_pres'],
+                 'tv' : ['pwlin_pres']}
+
+    tol = 1.0e-10
+
+    t = 0.3
+    y = [0.8, 0.7, 0.1, 0.05] # chamber activations
+
+    checks = []
+
+    for ode_parallel in [False, True]:
+
+        model = cardiovascular0Dsyspul(param(), chamber_models, ['volume']*5, ['pressure']*5, valvelaws=valvelaws, init=False, ode_par=ode_parallel, comm=comm)
+
+        n = model.numdof
+
+        # same (random) state on all processes - pressures and fluxes of both signs, so that valves are open as well as closed
+        rng = np.random.default_rng(1)
+        x_full = rng.uniform(-1.0, 10.0, n)
+        c = list(rng.uniform(0.0, 1.0, len(model.c_)))
+
+        # matrix and vector layout as in the 0D problem class
+        if ode_parallel:
+            K = PETSc.Mat().createAIJ(size=(n,n), bsize=None, nnz=None, csr=None, comm=comm)
+        else:
+            K = PETSc.Mat().createDense(size=(n,n), comm=MPI.COMM_SELF)
+        K.setUp()
+        K.assemble()
+        dK = K.duplicate(copy=True)
+
+        x = K.createVecLeft()
+
+        vs, ve = x.getOwnershipRange()
+        x.setValues(np.arange(vs, ve, dtype=PETSc.IntType), x_full[vs:ve])
+        x.assemble()
+
+        df, f = x.duplicate(), x.duplicate()
+        a = np.zeros(n)
+
+        model.evaluate(x, t, df, f, dK, K, c, y, a)
+
+        for obj in [df, f, dK, K]: obj.assemble()
+
+        # reference: separately lambdified entries
+        fnc = model.evaluate_chamber_state(y, t)
+        ev = lambda expr: float(sp.lambdify([model.x_, model.c_, model.t_, model.fnc_], expr, 'numpy')(x_full, c, t, fnc))
+
+        df_ref = np.array([ev(model.df_[i]) for i in range(n)])
+        f_ref  = np.array([ev(model.f_[i]) for i in range(n)])
+        a_ref  = np.array([ev(model.a_[i]) for i in range(n)])
+        dK_ref = np.array([[ev(model.dK_[i][j]) for j in range(n)] for i in range(n)])
+        K_ref  = np.array([[ev(model.K_[i][j]) for j in range(n)] for i in range(n)])
+
+        for nm, val, ref in [('df', gather_vec(df, comm, ode_parallel), df_ref),
+                             ('f',  gather_vec(f, comm, ode_parallel), f_ref),
+                             ('a',  a, a_ref),
+                             ('dK', gather_mat(dK, n, comm, ode_parallel), dK_ref),
+                             ('K',  gather_mat(K, n, comm, ode_parallel), K_ref)]:
+
+            err = np.abs(val - ref).max() / max(np.abs(ref).max(), 1.0)
+            ambit_fe.utilities.print_status("ode_parallel = %s: %s max. rel. error = %.4E" % (str(ode_parallel), nm, err), comm)
+            checks.append(err <= tol)
+
+    success = ambit_fe.resultcheck.success_check(checks, comm)
+
+    if not success:
+        raise RuntimeError("Test failed!")
+
+
+# full array of a serial or parallel vector on every process
+def gather_vec(v, comm, parallel):
+
+    if parallel:
+        return allgather_vec(v, comm)
+    else:
+        return v.array
+
+
+# full (dense) array of a serial or parallel matrix on every process
+def gather_mat(M, n, comm, parallel):
+
+    ms, me = M.getOwnershipRange()
+    M_loc = M.getValues(np.arange(ms, me, dtype=PETSc.IntType), np.arange(n, dtype=PETSc.IntType))
+
+    if parallel:
+        return np.vstack(comm.allgather(M_loc))
+    else:
+        return M_loc
+
+
+def param():
+
+    # parameters in kg-mm-s unit system
+
+    R_ar_sys = 120.0e-6
+    tau_ar_sys = 1.0311433159
+    tau_ar_pul = 0.3
+
+    # Diss Hirschvogel tab. 2.7
+    C_ar_sys = tau_ar_sys/R_ar_sys
+    Z_ar_sys = R_ar_sys/20.
+    R_ven_sys = R_ar_sys/5.
+    C_ven_sys = 30.*C_ar_sys
+    R_ar_pul = R_ar_sys/8.
+    C_ar_pul = tau_ar_pul/R_ar_pul
+    R_ven_pul = R_ar_pul
+    C_ven_pul = 2.5*C_ar_pul
+
+    L_ar_sys = 0.667e-6
+    L_ven_sys = 0.
+    L_ar_pul = 0.
+    L_ven_pul = 0.
+
+    # timings
+    t_ed = 0.2
+    t_es = 0.53
+    T_cycl = 1.0
+
+    # atrial elastances
+    E_at_max_l = 2.9e-5
+    E_at_min_l = 9.0e-6
+    E_at_max_r = 1.8e-5
+    E_at_min_r = 8.0e-6
+    # ventricular elastances
+    E_v_max_l = 30.0e-5
+    E_v_min_l = 12.0e-6
+    E_v_max_r = 20.0e-5
+    E_v_min_r = 10.0e-6
+
+
+    return {'R_ar_sys' : R_ar_sys,
+            'C_ar_sys' : C_ar_sys,
+            'L_ar_sys' : L_ar_sys,
+            'Z_ar_sys' : Z_ar_sys,
+            'R_ar_pul' : R_ar_pul,
+            'C_ar_pul' : C_ar_pul,
+            'L_ar_pul' : L_ar_pul,
+            'R_ven_sys' : R_ven_sys,
+            'C_ven_sys' : C_ven_sys,
+            'L_ven_sys' : L_ven_sys,
+            'R_ven_pul' : R_ven_pul,
+            'C_ven_pul' : C_ven_pul,
+            'L_ven_pul' : L_ven_pul,
+            # atrial elastances
+            'E_at_max_l' : E_at_max_l,
+            'E_at_min_l' : E_at_min_l,
+            'E_at_max_r' : E_at_max_r,
+            'E_at_min_r' : E_at_min_r,
+            # ventricular elastances
+            'E_v_max_l' : E_v_max_l,
+            'E_v_min_l' : E_v_min_l,
+            'E_v_max_r' : E_v_max_r,
+            'E_v_min_r' : E_v_min_r,
+            # valve resistances
+            'R_vin_l_min' : 1.0e-6,
+            'R_vin_l_max' : 1.0e1,
+            'R_vout_l_min' : 1.0e-6,
+            'R_vout_l_max' : 1.0e1,
+            'R_vin_r_min' : 1.0e-6,
+            'R_vin_r_max' : 1.0e1,
+            'R_vout_r_min' : 1.0e-6,
+            'R_vout_r_max' : 1.0e1,
+            # timings
+            't_ed' : t_ed,
+            't_es' : t_es,
+            'T_cycl' : T_cycl,
+            # unstressed compartment volumes (for post-processing)
+            'V_at_l_u' : 0.0,
+            'V_at_r_u' : 0.0,
+            'V_v_l_u' : 0.0,
+            'V_v_r_u' : 0.0,
+            'V_ar_sys_u' : 0.0,
+            'V_ar_pul_u' : 0.0,
+            'V_ven_sys_u' : 0.0,
+            'V_ven_pul_u' : 0.0}
+
+
+
+
+if __name__ == "__main__":
+
+    test_main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+
+"""
+closed-loop syspul 0D model with a prescribed variable (flux over mitral valve, q_vin_l, prescribed by a time curve)
+- solved with serial as well as with parallel 0D layout, both results have to coincide
+"""
+
+import ambit_fe
+
+import math
+import numpy as np
+from pathlib import Path
+import pytest
+
+
+@pytest.mark.flow0d
+def test_main():
+
+    basepath = str(Path(__file__).parent.absolute())
+
+    # define your time curves here (syntax: tcX refers to curve X)
+    class time_curves:
+
+        def tc1(self, t): # atrial activation
+
+            tmod = math.fmod(t, 1.0) # periodic function
+
+            act_dur = 2.*param()['t_ed']
+            t0 = 0.
+
+            if tmod >= t0 and tmod <= t0 + act_dur:
+                return 0.5*(1.-np.cos(2.*np.pi*(tmod-t0)/act_dur))
+            else:
+                return 0.0
+
+        def tc2(self, t): # ventricular activation
+
+            tmod = math.fmod(t, 1.0) # periodic function
+
+            act_dur = 1.8*(param()['t_es'] - param()['t_ed'])
+            t0 = param()['t_ed']
+
+            if tmod >= t0 and tmod <= t0 + act_dur:
+                return 0.5*(1.-np.cos(2.*np.pi*(tmod-t0)/act_dur))
+            else:
+                return 0.0
+
+        def tc3(self, t): # prescribed mitral valve flux
+
+            return 1.0e4*np.sin(np.pi*t)
+
+
+    s_sol = {}
+
+    for ode_parallel in [False, True]:
+
+        IO_PARAMS         = {'problem_type'          : 'flow0d',
+                             'write_results_every'   : -999,
+                             'output_path'           : basepath+'/tmp',
+                             'simname'               : 'test',
+                             'ode_parallel'          : ode_parallel}
+
+        SOLVER_PARAMS     = {'tol_res'               : 1.0e-8,
+                             'tol_inc'               : 1.0e-8}
+
+        TIME_PARAMS       = {'maxtime'               : 0.2,
+                             'numstep'               : 20,
+                             'timint'                : 'ost',
+                             'theta_ost'             : 0.5,
+                             'initial_conditions'    : init()}
+
+        MODEL_PARAMS      = {'modeltype'             : 'syspul',
+                             'parameters'            : param(),
+                             'chamber_models'        : {'lv' : {'type' : '0D_elast', 'activation_curve' : 2},
+                                                        'rv' : {'type' : '0D_elast', 'activation_curve' : 2},
+                                                        'la' : {'type' : '0D_elast', 'activation_curve' : 1},
+                                                        'ra' : {'type' : '0D_elast', 'activation_curve' : 1}},
+                             'valvelaws'             : {'av' : ['smooth_pres_momentum',0],
+                                                        'mv' : ['pwlin_pres'],
+                                                        'pv' : ['pwlin_pres'],
+                                                        'tv' : ['pwlin_pres']},
+                             'prescribed_variables'  : {'q_vin_l' : {'curve' : 3}}}
+
+        # problem setup
+        problem = ambit_fe.ambit_main.Ambit(IO_PARAMS, TIME_PARAMS, SOLVER_PARAMS, constitutive_params=MODEL_PARAMS, time_curves=time_curves())
+
+        # solve time-dependent problem
+        problem.solve_problem()
+
+        s_sol[ode_parallel] = problem.mp.cardvasc0D.gather_vec(problem.mp.s).copy()
+        q_id = problem.mp.cardvasc0D.varmap['q_vin_l']
+        comm = problem.mp.comm
+
+
+    # --- results check
+    tol = 1.0e-6
+
+    checks = []
+
+    # prescribed variable has to match the curve value at the end time
+    for ode_parallel in [False, True]:
+        err = abs(s_sol[ode_parallel][q_id] - time_curves().tc3(0.2))
+        ambit_fe.utilities.print_status("ode_parallel = %s: q_vin_l = %.16E,    CORR = %E,    err = %E" % (str(ode_parallel), s_sol[ode_parallel][q_id], time_curves().tc3(0.2), err), comm)
+        checks.append(err <= tol)
+
+    # serial and parallel layout have to give the same state
+    err = np.abs(s_sol[True] - s_sol[False]).max()
+    ambit_fe.utilities.print_status("max. difference serial/parallel 0D state = %E" % (err), comm)
+    checks.append(err <= tol)
+
+    success = ambit_fe.resultcheck.success_check(checks, comm)
+
+    if not success:
+        raise RuntimeError("Test failed!")
+
+
+
+def init():
+
+    return {'q_vin_l_0' : 0.0,
+            'p_at_l_0' : 0.599950804034,
+            'q_vout_l_0' : 0.0,
+            'p_v_l_0' : 0.599950804034,
+            'p_ar_sys_0' : 9.68378038166,
+            'q_ar_sys_0' : 0.0,
+            'p_ven_sys_0' : 2.13315841434,
+            'q_ven_sys_0' : 0.0,
+            'q_vin_r_0' : 0.0,
+            'p_at_r_0' : 0.0933256806275,
+            'q_vout_r_0' : 0.0,
+            'p_v_r_0' : 0.0933256806275,
+            'p_ar_pul_0' : 3.22792679389,
+            'q_ar_pul_0' : 0.0,
+            'p_ven_pul_0' : 1.59986881076,
+            'q_ven_pul_0' : 0.0}
+
+
+def param():
+
+    # parameters in kg-mm-s unit system
+
+    R_ar_sys = 120.0e-6
+    tau_ar_sys = 1.0311433159
+    tau_ar_pul = 0.3
+
+    # Diss Hirschvogel tab. 2.7
+    C_ar_sys = tau_ar_sys/R_ar_sys
+    Z_ar_sys = R_ar_sys/20.
+    R_ven_sys = R_ar_sys/5.
+    C_ven_sys = 30.*C_ar_sys
+    R_ar_pul = R_ar_sys/8.
+    C_ar_pul = tau_ar_pul/R_ar_pul
+    R_ven_pul = R_ar_pul
+    C_ven_pul = 2.5*C_ar_pul
+
+    L_ar_sys = 0.667e-6
+    L_ven_sys = 0.
+    L_ar_pul = 0.
+    L_ven_pul = 0.
+
+    # timings
+    t_ed = 0.2
+    t_es = 0.53
+    T_cycl = 1.0
+
+    # atrial elastances
+    E_at_max_l = 2.9e-5
+    E_at_min_l = 9.0e-6
+    E_at_max_r = 1.8e-5
+    E_at_min_r = 8.0e-6
+    # ventricular elastances
+    E_v_max_l = 30.0e-5
+    E_v_min_l = 12.0e-6
+    E_v_max_r = 20.0e-5
+    E_v_min_r = 10.0e-6
+
+
+    return {'R_ar_sys' : R_ar_sys,
+            'C_ar_sys' : C_ar_sys,
+            'L_ar_sys' : L_ar_sys,
+            'Z_ar_sys' : Z_ar_sys,
+            'R_ar_pul' : R_ar_pul,
+            'C_ar_pul' : C_ar_pul,
+            'L_ar_pul' : L_ar_pul,
+            'R_ven_sys' : R_ven_sys,
+            'C_ven_sys' : C_ven_sys,
+            'L_ven_sys' : L_ven_sys,
+            'R_ven_pul' : R_ven_pul,
+            'C_ven_pul' : C_ven_pul,
+            'L_ven_pul' : L_ven_pul,
+            # atrial elastances
+            'E_at_max_l' : E_at_max_l,
+            'E_at_min_l' : E_at_min_l,
+            'E_at_max_r' : E_at_max_r,
+            'E_at_min_r' : E_at_min_r,
+            # ventricular elastances
+            'E_v_max_l' : E_v_max_l,
+            'E_v_min_l' : E_v_min_l,
+            'E_v_max_r' : E_v_max_r,
+            'E_v_min_r' : E_v_min_r,
+            # valve resistances
+            'R_vin_l_min' : 1.0e-6,
+            'R_vin_l_max' : 1.0e1,
+            'R_vout_l_min' : 1.0e-6,
+            'R_vout_l_max' : 1.0e1,
+            'R_vin_r_min' : 1.0e-6,
+            'R_vin_r_max' : 1.0e1,
+            'R_vout_r_min' : 1.0e-6,
+            'R_vout_r_max' : 1.0e1,
+            # timings
+            't_ed' : t_ed,
+            't_es' : t_es,
+            'T_cycl' : T_cycl,
+            # unstressed compartment volumes (for post-processing)
+            'V_at_l_u' : 0.0,
+            'V_at_r_u' : 0.0,
+            'V_v_l_u' : 0.0,
+            'V_v_r_u' : 0.0,
+            'V_ar_sys_u' : 0.0,
+            'V_ar_pul_u' : 0.0,
+            'V_ven_sys_u' : 0.0,
+            'V_ven_pul_u' : 0.0}
+
+
+
+
+if __name__ == "__main__":
+
+    test_main()